@@ -10,6 +10,11 @@ from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisco
 from fastapi.responses import StreamingResponse
 import structlog
 
+try:
+    import orjson
+except ImportError:  # pulled in by chromadb, but not a direct dependency
+    orjson = None
+
 from app.models.chat import (
     ChatRequest, ChatResponse, ConversationCreateRequest, 
     ConversationListResponse, ConversationMessagesResponse,
@@ -25,6 +30,13 @@ logger = structlog.get_logger(__name__)
 router = APIRouter()
 
 
+def _dump_message(message: Dict[str, Any]) -> str:
+    """Serialize a WebSocket broadcast payload, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(message).decode()
+    return json.dumps(message)
+
+
 class ChatAPIError(APIException):
     """Chat API specific error."""
     
@@ -92,10 +104,11 @@ class WebSocketManager:
         
         # Send to all connections in the conversation
         disconnected_connections = []
+        payload = _dump_message(message)
         
         for websocket in self.active_connections[conversation_id]:
             try:
-                await websocket.send_text(json.dumps(message))
+                await websocket.send_text(payload)
             except Exception as e:
                 logger.warning(
                     "Failed to send WebSocket message",
@@ -129,10 +142,11 @@ class WebSocketManager:
             
             # Send to all connections except the sender
             if conversation_id in self.active_connections:
+                payload = _dump_message(message)
                 for websocket in self.active_connections[conversation_id]:
                     if websocket != exclude_websocket:
                         try:
-                            await websocket.send_text(json.dumps(message))
+                            await websocket.send_text(payload)
                         except Exception:
                             pass  # Will be cleaned up later
 
@@ -601,6 +615,8 @@ async def delete_conversation(
             "deleted_at": datetime.now().isoformat()
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(
             "Error deleting conversation",
@@ -45,4 +45,10 @@ async def api_status():
             "ollama_url": settings.ollama_url,
             "embedding_model": settings.EMBEDDING_MODEL
         }
-    }
\ No newline at end of file
+    }
+
+# Route paths are fixed once the router is assembled (newer FastAPI releases
+# keep included routers as lazy entries without a path; those are skipped)
+API_ROUTE_PATHS: tuple[str, ...] = tuple(
+    route.path for route in api_router.routes if hasattr(route, "path")
+)
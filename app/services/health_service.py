@@ -2,6 +2,7 @@
 
 import asyncio
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
 from datetime import datetime
 import httpx
@@ -31,6 +32,10 @@ class HealthService:
         self._last_check_time = None
         self._cached_status = None
         self._cache_duration = 30  # Cache health status for 30 seconds
+        self._probe_timeout = 10  # Report a probe unhealthy after 10 seconds
+        
+        # Blocking probe work runs here so it never stalls the event loop
+        self._probe_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="health-probe")
     
     async def get_health_status(self, force_refresh: bool = False) -> Dict[str, Any]:
         """Get comprehensive health status of all services.
@@ -52,12 +57,12 @@ class HealthService:
         
         logger.info("Performing health check", force_refresh=force_refresh)
         
-        # Perform health checks concurrently
+        # Perform health checks concurrently, each bounded by the probe timeout
         health_checks = await asyncio.gather(
-            self._check_chroma_health(),
-            self._check_ollama_health(),
-            self._check_embedding_service_health(),
-            self._check_system_resources(),
+            self._with_timeout(self._check_chroma_health()),
+            self._with_timeout(self._check_ollama_health()),
+            self._with_timeout(self._check_embedding_service_health()),
+            self._with_timeout(self._check_system_resources()),
             return_exceptions=True
         )
         
@@ -118,6 +123,16 @@ class HealthService:
         
         return status
     
+    async def _with_timeout(self, probe) -> Dict[str, Any]:
+        """Await a health probe, reporting it unhealthy if it exceeds the probe timeout."""
+        try:
+            return await asyncio.wait_for(probe, timeout=self._probe_timeout)
+        except asyncio.TimeoutError:
+            return {
+                "status": HealthStatus.UNHEALTHY,
+                "error": f"Health check timed out after {self._probe_timeout}s"
+            }
+    
     async def _check_chroma_health(self) -> Dict[str, Any]:
         """Check ChromaDB health."""
         try:
@@ -233,10 +248,11 @@ class HealthService:
         try:
             import psutil
             
-            # Get system metrics
-            cpu_percent = psutil.cpu_percent(interval=1)
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
+            # Get system metrics (cpu_percent blocks for its whole sampling interval)
+            loop = asyncio.get_running_loop()
+            cpu_percent, memory, disk = await loop.run_in_executor(
+                self._probe_pool, self._sample_system_resources, psutil
+            )
             
             # Determine status based on resource usage
             status = HealthStatus.HEALTHY
@@ -277,6 +293,11 @@ class HealthService:
                 "error": str(e)
             }
     
+    @staticmethod
+    def _sample_system_resources(psutil):
+        """Sample CPU, memory and disk usage (blocking)."""
+        return psutil.cpu_percent(interval=1), psutil.virtual_memory(), psutil.disk_usage('/')
+    
     async def check_service_connectivity(self, service_name: str) -> Dict[str, Any]:
         """Check connectivity to a specific service.
         
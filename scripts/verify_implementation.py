@@ -1,41 +1,56 @@
 #!/usr/bin/env python3
 """Verification script for Task 1 implementation."""
 
+import itertools
 import sys
 import os
-from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Files and directories expected by the Task 1 foundation, relative to the project root
+REQUIRED_PATHS: tuple[str, ...] = (
+    "app/__init__.py",
+    "app/main.py",
+    "app/core/__init__.py",
+    "app/core/config.py",
+    "app/core/exceptions.py",
+    "app/models/__init__.py",
+    "app/models/common.py",
+    "app/models/document.py",
+    "app/models/chunk.py",
+    "app/models/search.py",
+    "app/models/chat.py",
+    "app/models/config.py",
+    "app/api/__init__.py",
+    "app/api/routes.py",
+    "tests/__init__.py",
+    "tests/test_models.py",
+    "tests/test_config.py",
+    "tests/test_exceptions.py",
+    "requirements.txt",
+)
+
+# Required entry names grouped by parent directory, so each directory is listed only once
+_REQUIRED_BY_DIR: dict[str, frozenset[str]] = {
+    directory: frozenset(os.path.basename(path) for path in paths)
+    for directory, paths in itertools.groupby(
+        sorted(REQUIRED_PATHS, key=os.path.dirname), key=os.path.dirname
+    )
+}
+
+
 def verify_project_structure():
     """Verify that all required files and directories exist."""
-    required_paths = [
-        "app/__init__.py",
-        "app/main.py",
-        "app/core/__init__.py",
-        "app/core/config.py",
-        "app/core/exceptions.py",
-        "app/models/__init__.py",
-        "app/models/common.py",
-        "app/models/document.py",
-        "app/models/chunk.py",
-        "app/models/search.py",
-        "app/models/chat.py",
-        "app/models/config.py",
-        "app/api/__init__.py",
-        "app/api/routes.py",
-        "tests/__init__.py",
-        "tests/test_models.py",
-        "tests/test_config.py",
-        "tests/test_exceptions.py",
-        "requirements.txt"
-    ]
-    
     missing_paths = []
-    for path in required_paths:
-        if not Path(path).exists():
-            missing_paths.append(path)
+    for directory, names in _REQUIRED_BY_DIR.items():
+        try:
+            with os.scandir(directory or ".") as entries:
+                present = {entry.name for entry in entries}
+        except OSError:
+            present = set()
+        for name in sorted(names - present):
+            missing_paths.append(os.path.join(directory, name))
     
     if missing_paths:
         print("❌ Missing required files:")
@@ -191,7 +206,13 @@ def verify_fastapi_app():
 
 
 def main():
-    """Run all verification checks."""
+    """Run all verification checks.
+
+    Pass ``--fail-fast`` to stop at the first failing check instead of running
+    the remaining ones against a broken tree.
+    """
+    fail_fast = "--fail-fast" in sys.argv[1:]
+
     print("🔍 Verifying Task 1 Implementation: Setup project foundation and core data models")
     print("=" * 80)
     
@@ -213,6 +234,9 @@ def main():
             passed += 1
         else:
             print(f"   Failed verification for {name}")
+            if fail_fast:
+                print("🛑 Skipped remaining checks (--fail-fast)")
+                break
     
     print("\n" + "=" * 80)
     print(f"📊 Results: {passed}/{total} checks passed")
@@ -8,6 +8,10 @@ import os
 import sys
 import subprocess
 import shutil
+import socket
+import time
+import urllib.error
+import urllib.request
 import asyncio
 import asyncpg
 from pathlib import Path
@@ -206,10 +210,15 @@ class StudyRAGSetup:
             subprocess.Popen(["ollama", "serve"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             console.print("[blue]Démarrage du serveur Ollama...[/blue]")
             
-            # Attendre que le serveur soit prêt
-            import time
-            time.sleep(3)
-            
+            # Attendre que le serveur soit prêt (10s maximum)
+            deadline = time.monotonic() + 10
+            while time.monotonic() < deadline:
+                try:
+                    urllib.request.urlopen("http://localhost:11434/", timeout=0.5).close()
+                    break
+                except (urllib.error.URLError, socket.timeout, ConnectionError):
+                    time.sleep(0.1)
+
             # Télécharger un modèle recommandé
             if Confirm.ask("Télécharger le modèle llama3.2 (recommandé) ?", default=True):
                 console.print("[blue]Téléchargement du modèle llama3.2...[/blue]")
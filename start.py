@@ -4,56 +4,160 @@ Script de démarrage StudyRAG
 Démarre automatiquement le backend et le frontend pour les tests
 """
 
+import asyncio
+import functools
+import hashlib
 import os
+import queue
+import re
+import shutil
 import sys
 import subprocess
-import time
 import signal
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from urllib.parse import urlparse
 from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-import requests
 import json
 
 console = Console()
 
+# Empreintes des manifestes et lockfiles (pyproject.toml + uv.lock,
+# package.json + package-lock.json) de la dernière installation
+LOCK_CACHE_FILE = Path.home() / ".cache" / "studyrag" / "lock.json"
+
+# Lignes de log des services à ne pas afficher (trop verbeuses)
+_SKIP_RE = re.compile(rb'(?i)info:|debug:|started server')
+
+def _lock_digest(*paths):
+    """Empreinte commune d'un manifeste et de son lockfile, ou None si l'un manque"""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in paths:
+        try:
+            with open(path, "rb") as f:
+                content = f.read()
+        except OSError:
+            return None
+        # Longueur en préfixe: le contenu d'un fichier ne peut pas déborder sur l'autre
+        digest.update(len(content).to_bytes(8, "little"))
+        digest.update(content)
+    return digest.hexdigest()
+
+
+def _load_lock_cache():
+    """Empreintes des dépendances lors de la dernière installation réussie, par projet"""
+    try:
+        with open(LOCK_CACHE_FILE, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_lock_cache(cache):
+    """Enregistre les empreintes des dépendances installées"""
+    try:
+        LOCK_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(LOCK_CACHE_FILE, "w") as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+
+async def _spawn(cmd, cwd):
+    """Lance un service avec sa sortie (stdout + stderr) redirigée vers un pipe
+    
+    Sans preexec_fn ni start_new_session et avec un exécutable résolu en chemin
+    absolu, CPython crée l'enfant via vfork()/posix_spawn() au lieu de fork():
+    les tables de pages du parent ne sont pas copiées.
+    """
+    executable = shutil.which(cmd[0]) or cmd[0]
+    return await asyncio.create_subprocess_exec(
+        executable, *cmd[1:],
+        cwd=cwd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        limit=64 * 1024,
+        start_new_session=False
+    )
+
+
 class StudyRAGStarter:
     def __init__(self):
         self.processes = []
+        self._installers = []
         self.backend_port = 8000
         self.frontend_port = 3000
         self.ollama_port = 11434
         self.project_root = Path(__file__).parent
         
+        # Session HTTP partagée, créée à la première sonde (voir la propriété http)
+        self._http = None
+        
+        # Logs des services: file bornée vidée par un seul thread d'écriture
+        self._log_q = queue.Queue(maxsize=10000)
+        self._flusher = None
+        
+    @property
+    def http(self):
+        """Session HTTP partagée: les sondes successives réutilisent la connexion keep-alive"""
+        if self._http is None:
+            # requests n'est importé qu'au premier usage
+            import requests
+            from requests.adapters import HTTPAdapter
+            
+            self._http = requests.Session()
+            self._http.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0))
+            self._http.headers["Connection"] = "keep-alive"
+        return self._http
+        
     def check_dependencies(self):
         """Vérifie que les dépendances sont installées"""
         console.print("[blue]🔍 Vérification des dépendances...[/blue]")
         
-        # Vérifier UV
-        try:
-            subprocess.run(["uv", "--version"], check=True, capture_output=True)
-            console.print("✅ UV installé")
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        # Recherche dans le PATH d'abord: aucun processus lancé si un outil manque
+        if shutil.which("uv") is None:
             console.print("[red]❌ UV non trouvé. Installez UV: https://docs.astral.sh/uv/[/red]")
             return False
         
-        # Vérifier Node.js pour le frontend
-        try:
-            subprocess.run(["node", "--version"], check=True, capture_output=True)
-            subprocess.run(["npm", "--version"], check=True, capture_output=True)
-            console.print("✅ Node.js et npm installés")
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        if shutil.which("node") is None or shutil.which("npm") is None:
             console.print("[red]❌ Node.js/npm non trouvé. Installez Node.js: https://nodejs.org/[/red]")
             return False
         
+        # Relever les versions en un seul processus (trois sous Windows).
+        # stderr est ignoré par le noyau et le code retour est lu directement,
+        # sans check=True ni exception dans le cas courant.
+        if sys.platform == "win32":
+            probes = [
+                subprocess.run([shutil.which(tool), "--version"],
+                               stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+                for tool in ("uv", "node", "npm")
+            ]
+            returncode = max(probe.returncode for probe in probes)
+            output = b"\n".join(probe.stdout.strip() for probe in probes)
+        else:
+            probe = subprocess.run(
+                ["sh", "-c", "uv --version && node --version && npm --version"],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            )
+            returncode, output = probe.returncode, probe.stdout
+        
+        if returncode != 0:
+            console.print("[red]❌ Impossible d'exécuter uv/node/npm[/red]")
+            return False
+        
+        versions = output.decode("utf-8", errors="replace").split("\n")
+        uv_version, node_version, npm_version = (versions + ["", "", ""])[:3]
+        console.print(f"✅ UV installé ({uv_version.strip()})")
+        console.print(f"✅ Node.js ({node_version.strip()}) et npm ({npm_version.strip()}) installés")
+        
         return True
     
     def check_ollama(self):
         """Vérifie si Ollama est disponible"""
         try:
-            response = requests.get(f"http://localhost:{self.ollama_port}/api/tags", timeout=5)
+            response = self.http.get(f"http://localhost:{self.ollama_port}/api/tags", timeout=5)
             if response.status_code == 200:
                 models = response.json().get('models', [])
                 console.print(f"✅ Ollama disponible avec {len(models)} modèles")
@@ -88,29 +192,69 @@ class StudyRAGStarter:
             
             console.print("✅ Fichier .env créé")
         
-        # Synchroniser les dépendances Python
-        console.print("📦 Installation des dépendances Python...")
-        try:
-            subprocess.run(["uv", "sync"], cwd=self.project_root, check=True)
-            console.print("✅ Dépendances Python installées")
-        except subprocess.CalledProcessError:
-            console.print("[red]❌ Erreur lors de l'installation des dépendances Python[/red]")
-            return False
-        
-        # Installer les dépendances frontend
+        # uv sync et npm install sont indépendants: on les lance en parallèle
         frontend_dir = self.project_root / "frontend"
+        installs = [("uv", ["uv", "sync"], self.project_root,
+                     (self.project_root / "pyproject.toml", self.project_root / "uv.lock"),
+                     self.project_root / ".venv",
+                     "Dépendances Python installées",
+                     "Erreur lors de l'installation des dépendances Python")]
+        
         if frontend_dir.exists():
-            console.print("📦 Installation des dépendances frontend...")
-            try:
-                subprocess.run(["npm", "install"], cwd=frontend_dir, check=True)
-                console.print("✅ Dépendances frontend installées")
-            except subprocess.CalledProcessError:
-                console.print("[red]❌ Erreur lors de l'installation des dépendances frontend[/red]")
-                return False
+            installs.append(("npm", ["npm", "install"], frontend_dir,
+                             (frontend_dir / "package.json", frontend_dir / "package-lock.json"),
+                             frontend_dir / "node_modules",
+                             "Dépendances frontend installées",
+                             "Erreur lors de l'installation des dépendances frontend"))
         
-        return True
+        # Ignorer les installations dont ni le manifeste ni le lockfile n'ont
+        # changé depuis le dernier succès
+        all_caches = _load_lock_cache()
+        lock_cache = all_caches.setdefault(str(self.project_root.resolve()), {})
+        running = []
+        for tag, cmd, cwd, dependency_files, installed_dir, ok_message, error_message in installs:
+            digest = _lock_digest(*dependency_files)
+            if digest is not None and lock_cache.get(tag) == digest and installed_dir.exists():
+                console.print(f"✅ \\[{tag}] {ok_message} (dépendances inchangées)")
+                continue
+            
+            console.print(f"📦 \\[{tag}] {' '.join(cmd)}...")
+            # Groupe de processus dédié: une interruption arrête aussi les sous-processus
+            process = subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE,
+                                       stderr=subprocess.STDOUT, start_new_session=True)
+            self._installers.append(process)
+            running.append((tag, process, digest, ok_message, error_message))
+        
+        if not running:
+            return True
+        
+        def stream(entry):
+            """Affiche la sortie d'un installateur au fil de l'eau, préfixée par son tag"""
+            tag, process, _, _, _ = entry
+            for line in process.stdout:
+                line = line.decode("utf-8", errors="replace").rstrip()
+                if line:
+                    console.print(f"[{tag}] {line}", markup=False, highlight=False)
+            return process.wait()
+        
+        success = True
+        with ThreadPoolExecutor(max_workers=len(running)) as executor:
+            for (tag, _, digest, ok_message, error_message), returncode in zip(
+                running, executor.map(stream, running)
+            ):
+                if returncode == 0:
+                    console.print(f"✅ \\[{tag}] {ok_message}")
+                    if digest is not None:
+                        lock_cache[tag] = digest
+                else:
+                    console.print(f"[red]❌ \\[{tag}] {error_message}[/red]")
+                    lock_cache.pop(tag, None)
+                    success = False
+        
+        _save_lock_cache(all_caches)
+        return success
     
-    def start_backend(self):
+    async def start_backend(self):
         """Démarre le backend FastAPI"""
         console.print("[green]🚀 Démarrage du backend...[/green]")
         
@@ -124,23 +268,16 @@ class StudyRAGStarter:
             "--log-level", "info"
         ]
         
-        process = subprocess.Popen(
-            cmd,
-            cwd=self.project_root,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            universal_newlines=True,
-            bufsize=1
-        )
+        process = await _spawn(cmd, self.project_root)
         
         self.processes.append(("Backend", process))
         
         # Attendre que le backend soit prêt
-        self.wait_for_service("Backend", f"http://localhost:{self.backend_port}/health", 30)
+        await self.wait_for_service("Backend", f"http://localhost:{self.backend_port}/health", 30)
         
         return process
     
-    def start_frontend(self):
+    async def start_frontend(self):
         """Démarre le frontend Next.js"""
         frontend_dir = self.project_root / "frontend"
         if not frontend_dir.exists():
@@ -151,134 +288,234 @@ class StudyRAGStarter:
         
         cmd = ["npm", "run", "dev"]
         
-        process = subprocess.Popen(
-            cmd,
-            cwd=frontend_dir,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            universal_newlines=True,
-            bufsize=1
-        )
+        process = await _spawn(cmd, frontend_dir)
         
         self.processes.append(("Frontend", process))
         
         # Attendre que le frontend soit prêt
-        self.wait_for_service("Frontend", f"http://localhost:{self.frontend_port}", 30)
+        await self.wait_for_service("Frontend", f"http://localhost:{self.frontend_port}", 30)
         
         return process
     
-    def wait_for_service(self, name, url, timeout=30):
+    async def wait_for_service(self, name, url, timeout=30):
         """Attend qu'un service soit disponible"""
         console.print(f"⏳ Attente du démarrage de {name}...")
         
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        import requests
+        
+        loop = asyncio.get_running_loop()
+        parsed = urlparse(url)
+        host, port = parsed.hostname or "localhost", parsed.port or 80
+        
+        deadline = loop.time() + timeout
+        attempt = 0
+        while loop.time() < deadline:
+            # Test TCP d'abord: inutile de faire une requête HTTP tant que rien n'écoute
             try:
-                response = requests.get(url, timeout=2)
-                if response.status_code < 500:  # Service répond
-                    console.print(f"✅ {name} démarré sur {url}")
-                    return True
-            except:
-                pass
-            time.sleep(1)
+                _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), 0.5)
+                writer.close()
+                listening = True
+            except (OSError, asyncio.TimeoutError):
+                listening = False
+            
+            if listening:
+                try:
+                    response = await loop.run_in_executor(
+                        None, functools.partial(self.http.get, url, timeout=2)
+                    )
+                    if response.status_code < 500:  # Service répond
+                        console.print(f"✅ {name} démarré sur {url}")
+                        return True
+                except requests.RequestException:
+                    pass
+            
+            await asyncio.sleep(min(0.05 * 2 ** attempt, 0.5))
+            attempt += 1
         
         console.print(f"[yellow]⚠️ {name} met du temps à démarrer...[/yellow]")
         return False
     
     def show_status(self):
         """Affiche le statut des services"""
-        console.print("\n" + "="*60)
-        console.print(Panel.fit(
-            f"[bold green]StudyRAG démarré avec succès![/bold green]\n\n"
-            f"🌐 Frontend: http://localhost:{self.frontend_port}\n"
-            f"🔧 Backend API: http://localhost:{self.backend_port}\n"
-            f"📚 Documentation: http://localhost:{self.backend_port}/docs\n"
-            f"❤️ Health Check: http://localhost:{self.backend_port}/health\n\n"
-            f"[yellow]Appuyez sur Ctrl+C pour arrêter tous les services[/yellow]",
-            title="🎓 StudyRAG - Prêt pour les tests!",
-            border_style="green"
+        from rich.console import Group
+        from rich.panel import Panel
+        
+        # Un seul rendu pour l'ensemble (séparateurs + panneau)
+        console.print(Group(
+            "\n" + "="*60,
+            Panel.fit(
+                f"[bold green]StudyRAG démarré avec succès![/bold green]\n\n"
+                f"🌐 Frontend: http://localhost:{self.frontend_port}\n"
+                f"🔧 Backend API: http://localhost:{self.backend_port}\n"
+                f"📚 Documentation: http://localhost:{self.backend_port}/docs\n"
+                f"❤️ Health Check: http://localhost:{self.backend_port}/health\n\n"
+                f"[yellow]Appuyez sur Ctrl+C pour arrêter tous les services[/yellow]",
+                title="🎓 StudyRAG - Prêt pour les tests!",
+                border_style="green"
+            ),
+            "="*60 + "\n"
         ))
-        console.print("="*60 + "\n")
+    
+    def flush_logs(self):
+        """Écrit les logs des services par lots (256 lignes ou 50 ms) en un seul write()"""
+        while True:
+            # Attente bloquante sans réveil périodique: le sentinelle None arrête le thread
+            batch = [self._log_q.get()]
+            
+            # Regrouper les lignes suivantes jusqu'à 256 lignes ou 50 ms
+            deadline = time.monotonic() + 0.05
+            while batch[-1] is not None and len(batch) < 256:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._log_q.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            stop = batch[-1] is None
+            lines = [line for line in batch if line is not None]
+            if lines:
+                sys.stdout.write("\n".join(lines) + "\n")
+                sys.stdout.flush()
+            if stop:
+                return
     
     def monitor_processes(self):
         """Surveille les processus en arrière-plan"""
-        def log_output(name, process):
-            """Log la sortie d'un processus"""
-            for line in iter(process.stdout.readline, ''):
-                if line.strip():
-                    # Filtrer les logs trop verbeux
-                    if any(skip in line.lower() for skip in ['info:', 'debug:', 'started server']):
-                        continue
-                    console.print(f"[dim]{name}:[/dim] {line.strip()}")
-        
-        # Créer des threads pour surveiller chaque processus
-        for name, process in self.processes:
-            thread = threading.Thread(target=log_output, args=(name, process), daemon=True)
-            thread.start()
+        async def forward(name, process):
+            """Transmet les lignes d'un processus au thread d'écriture"""
+            while True:
+                try:
+                    line = await process.stdout.readline()
+                except ValueError:
+                    continue  # Ligne plus longue que la limite du StreamReader: ignorée
+                if not line:
+                    break
+                # Filtrer les logs trop verbeux avant tout décodage
+                if line.strip() and not _SKIP_RE.search(line):
+                    try:
+                        self._log_q.put_nowait(f"{name}: {line.decode('utf-8', errors='replace').strip()}")
+                    except queue.Full:
+                        pass  # File pleine: la ligne est abandonnée plutôt que de bloquer
+        
+        self._flusher = threading.Thread(target=self.flush_logs, daemon=True)
+        self._flusher.start()
+        
+        return [asyncio.ensure_future(forward(name, process)) for name, process in self.processes]
     
-    def cleanup(self):
+    async def wait_for_exit(self):
+        """Attend l'arrêt d'un des services et renvoie son nom"""
+        waiters = {
+            asyncio.ensure_future(process.wait()): name
+            for name, process in self.processes
+        }
+        try:
+            done, _ = await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+        return waiters[next(iter(done))]
+    
+    async def cleanup(self):
         """Nettoie les processus"""
         console.print("\n[yellow]🛑 Arrêt des services...[/yellow]")
         
+        # Installations interrompues: tout leur groupe est arrêté pour fermer le
+        # pipe, ce qui termine aussi leur thread de lecture
+        for process in self._installers:
+            if process.poll() is None:
+                if sys.platform == "win32":
+                    process.terminate()
+                else:
+                    try:
+                        os.killpg(process.pid, signal.SIGTERM)
+                    except ProcessLookupError:
+                        pass
+        
         for name, process in self.processes:
-            if process.poll() is None:  # Processus encore en vie
+            if process.returncode is None:  # Processus encore en vie
                 console.print(f"Arrêt de {name}...")
                 process.terminate()
                 
                 # Attendre un peu puis forcer l'arrêt si nécessaire
                 try:
-                    process.wait(timeout=5)
-                except subprocess.TimeoutExpired:
+                    await asyncio.wait_for(process.wait(), timeout=5)
+                except asyncio.TimeoutError:
                     process.kill()
-                    process.wait()
+                    await process.wait()
+        
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+        
+        # Vider les derniers logs avant le message final
+        if self._flusher is not None:
+            self._log_q.put(None)
+            self._flusher.join(timeout=1)
+            self._flusher = None
         
         console.print("[green]✅ Tous les services arrêtés[/green]")
     
     def run(self):
         """Lance l'application complète"""
+        try:
+            return asyncio.run(self._run())
+        except KeyboardInterrupt:
+            return 0
+    
+    async def _run(self):
+        """Démarre puis supervise les services dans la boucle asyncio"""
+        if sys.platform != "win32":
+            # SIGTERM annule la tâche principale: le bloc finally arrête les services
+            asyncio.get_running_loop().add_signal_handler(
+                signal.SIGTERM, asyncio.current_task().cancel
+            )
+        
+        monitor_tasks = []
         try:
             # Vérifications préliminaires
             if not self.check_dependencies():
                 return 1
             
-            self.check_ollama()
+            # Sonde HTTP et installations hors de la boucle: Ctrl+C reste immédiat
+            await asyncio.to_thread(self.check_ollama)
             
-            if not self.setup_environment():
+            if not await asyncio.to_thread(self.setup_environment):
                 return 1
             
             # Démarrage des services
-            backend_process = self.start_backend()
-            frontend_process = self.start_frontend()
+            await self.start_backend()
+            await self.start_frontend()
             
             # Surveillance des processus
-            self.monitor_processes()
+            monitor_tasks = self.monitor_processes()
             
             # Affichage du statut
             self.show_status()
             
             # Attendre l'interruption
-            try:
-                while True:
-                    # Vérifier que les processus sont toujours en vie
-                    for name, process in self.processes:
-                        if process.poll() is not None:
-                            console.print(f"[red]❌ {name} s'est arrêté inopinément[/red]")
-                            return 1
-                    time.sleep(1)
-            except KeyboardInterrupt:
-                console.print("\n[yellow]Interruption détectée...[/yellow]")
+            name = await self.wait_for_exit()
+            console.print(f"[red]❌ {name} s'est arrêté inopinément[/red]")
+            return 1
             
+        except asyncio.CancelledError:
+            console.print("\n[yellow]Interruption détectée...[/yellow]")
         except Exception as e:
             console.print(f"[red]❌ Erreur: {e}[/red]")
             return 1
         finally:
-            self.cleanup()
+            for task in monitor_tasks:
+                task.cancel()
+            await self.cleanup()
         
         return 0
 
 
 def main():
     """Point d'entrée principal"""
+    from rich.panel import Panel
+    
     console.print(Panel.fit(
         "[bold blue]StudyRAG - Script de Démarrage[/bold blue]\n"
         "Démarre automatiquement le backend et frontend pour les tests",
@@ -286,16 +523,8 @@ def main():
         border_style="blue"
     ))
     
+    # Ctrl+C et SIGTERM annulent la boucle asyncio, qui arrête proprement les services
     starter = StudyRAGStarter()
-    
-    # Gérer les signaux pour un arrêt propre
-    def signal_handler(signum, frame):
-        starter.cleanup()
-        sys.exit(0)
-    
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
-    
     return starter.run()
 
 
@@ -5,35 +5,105 @@ Comprehensive startup script with health checks and configuration validation
 """
 
 import asyncio
+import importlib.util
+import io
 import os
 import sys
 import subprocess
+import threading
 import time
 import json
+import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional
-import requests
-import psutil
+from typing import Dict, Any, Optional, Tuple
 
 # Add the app directory to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
+# KEY=value assignment in a .env file (comments and blank lines do not match)
+_ENV_RE = re.compile(r'^\s*([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(.*?)\s*$')
+
+# users:(("name",pid=123,fd=4)) field in `ss -p` output
+_SS_USER_RE = re.compile(r'users:\(\("([^"]+)",pid=(\d+)')
+
+_thread_output = threading.local()
+
+
+class _PerThreadStdout:
+    """sys.stdout proxy that redirects writes to a per-thread buffer when one is set"""
+    
+    def __init__(self, stream):
+        self._stream = stream
+    
+    def write(self, text):
+        buffer = getattr(_thread_output, 'buffer', None)
+        return (buffer if buffer is not None else self._stream).write(text)
+    
+    def flush(self):
+        self._stream.flush()
+    
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def _run_captured(check_func):
+    """Run a check in the current thread and return (result, captured output)"""
+    _thread_output.buffer = io.StringIO()
+    try:
+        try:
+            result = check_func()
+        except Exception as e:
+            print(f"  ❌ Erreur inattendue: {e}")
+            result = False
+        return result, _thread_output.buffer.getvalue()
+    finally:
+        _thread_output.buffer = None
+
+
+def _list_entries(path: str, directories: bool) -> set:
+    """Names of the directories (or regular files) directly under path"""
+    try:
+        with os.scandir(path) as entries:
+            return {
+                entry.name for entry in entries
+                if (entry.is_dir() if directories else entry.is_file())
+            }
+    except OSError:
+        return set()
+
+
 class StudyRAGStarter:
     def __init__(self):
         self.config = self.load_config()
         self.health_checks = []
         
+        # Shared HTTP session, created on first use (see the http property)
+        self._http = None
+        
+    @property
+    def http(self):
+        """Shared HTTP session so repeated probes reuse a keep-alive connection"""
+        if self._http is None:
+            # requests is only imported when a probe actually needs it
+            import requests
+            from requests.adapters import HTTPAdapter
+            
+            self._http = requests.Session()
+            self._http.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0))
+            self._http.headers['Connection'] = 'keep-alive'
+        return self._http
+        
     def load_config(self) -> Dict[str, Any]:
         """Load configuration from environment and defaults"""
-        # Load .env file if it exists
+        # Load .env file if it exists; variables already exported take precedence
         env_file = Path('.env')
         if env_file.exists():
             with open(env_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        os.environ[key] = value
+                for match in map(_ENV_RE.match, f):
+                    if match:
+                        os.environ.setdefault(match.group(1), match.group(2))
         
         return {
             'database_url': os.getenv('DATABASE_URL', 'sqlite:///./study_rag.db'),
@@ -90,10 +160,16 @@ class StudyRAGStarter:
         missing_packages = []
         
         for package in required_packages:
+            # find_spec locates the package without executing it, so heavy
+            # imports (torch via sentence_transformers, docling, ...) are skipped
             try:
-                __import__(package.replace('-', '_'))
+                found = importlib.util.find_spec(package.replace('-', '_')) is not None
+            except (ImportError, ValueError):
+                found = False
+            
+            if found:
                 print(f"  ✅ {package}")
-            except ImportError:
+            else:
                 print(f"  ❌ {package} (manquant)")
                 missing_packages.append(package)
         
@@ -118,10 +194,17 @@ class StudyRAGStarter:
                 # Extract path from sqlite:///./study_rag.db
                 db_path = db_url.replace('sqlite:///', '')
                 
-                # Test connection
-                conn = sqlite3.connect(db_path)
-                conn.execute("SELECT 1")
-                conn.close()
+                # Read-only open when the file exists (no journal setup); the
+                # handle is closed right away since the server opens its own
+                mode = 'ro' if os.path.exists(db_path) else 'rwc'
+                conn = sqlite3.connect(
+                    f"file:{db_path}?mode={mode}",
+                    uri=True, isolation_level=None
+                )
+                try:
+                    conn.execute("PRAGMA schema_version").fetchone()
+                finally:
+                    conn.close()
                 print("  ✅ Base de données SQLite accessible")
                 return True
             except Exception as e:
@@ -164,8 +247,10 @@ class StudyRAGStarter:
         """Check Ollama service availability"""
         print("🤖 Vérification du service Ollama...")
         
+        import requests
+        
         try:
-            response = requests.get(f"{self.config['ollama_url']}/api/tags", timeout=5)
+            response = self.http.get(f"{self.config['ollama_url']}/api/tags", timeout=5)
             if response.status_code == 200:
                 data = response.json()
                 models = data.get('models', [])
@@ -204,9 +289,12 @@ class StudyRAGStarter:
             'chroma_db'
         ]
         
+        # One directory listing instead of a stat per entry
+        existing = _list_entries('.', directories=True)
+        
         for dir_name in required_dirs:
             dir_path = Path(dir_name)
-            if dir_path.exists():
+            if dir_name in existing:
                 print(f"  ✅ {dir_name}/")
             else:
                 try:
@@ -228,8 +316,10 @@ class StudyRAGStarter:
             'static/styles.css'
         ]
         
+        existing = _list_entries('static', directories=False)
+        
         for file_path in required_files:
-            if Path(file_path).exists():
+            if os.path.basename(file_path) in existing:
                 print(f"  ✅ {file_path}")
             else:
                 print(f"  ❌ {file_path} manquant")
@@ -241,37 +331,94 @@ class StudyRAGStarter:
         """Check if the port is available"""
         print(f"🔌 Vérification du port {self.config['port']}...")
         
+        port = self.config['port']
         try:
+            import errno
             import socket
+            # Binding tells us whether the port is free without sending any packet
+            # (connect_ex would perform a TCP handshake against the listener).
+            # Bind the way uvicorn does: with SO_REUSEADDR on POSIX so lingering
+            # TIME_WAIT sockets from a previous run don't count as "in use"; on
+            # Windows SO_REUSEADDR would let us bind over a live listener.
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                result = s.connect_ex(('localhost', self.config['port']))
-                if result == 0:
-                    print(f"  ❌ Port {self.config['port']} déjà utilisé")
-                    
-                    # Try to find what's using the port
-                    for proc in psutil.process_iter(['pid', 'name', 'connections']):
-                        try:
-                            for conn in proc.info['connections'] or []:
-                                if conn.laddr.port == self.config['port']:
-                                    print(f"  💡 Utilisé par: {proc.info['name']} (PID: {proc.info['pid']})")
-                                    break
-                        except (psutil.NoSuchProcess, psutil.AccessDenied):
-                            pass
-                    
-                    return False
-                else:
-                    print(f"  ✅ Port {self.config['port']} disponible")
-                    return True
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 0 if os.name == 'nt' else 1)
+                try:
+                    s.bind((self.config['host'], port))
+                    in_use = False
+                except OSError as e:
+                    in_use = e.errno in (errno.EADDRINUSE, getattr(errno, 'WSAEADDRINUSE', errno.EADDRINUSE))
+            
+            if in_use:
+                print(f"  ❌ Port {port} déjà utilisé")
+                
+                # Try to find what's using the port
+                owner = self.find_port_owner(port)
+                if owner:
+                    print(f"  💡 Utilisé par: {owner[0]} (PID: {owner[1]})")
+                
+                return False
+            else:
+                print(f"  ✅ Port {port} disponible")
+                return True
         except Exception as e:
             print(f"  ⚠️  Impossible de vérifier le port: {e}")
             return True  # Assume it's available
     
+    def find_port_owner(self, port: int) -> Optional[Tuple[str, int]]:
+        """Return (process name, pid) of the process listening on port, if found"""
+        # Linux: one ss invocation instead of walking /proc for every process
+        if shutil.which('ss'):
+            try:
+                result = subprocess.run(
+                    ['ss', '-Htnlp', f'sport = :{port}'],
+                    capture_output=True, text=True, timeout=1
+                )
+                match = _SS_USER_RE.search(result.stdout)
+                if match:
+                    return match.group(1), int(match.group(2))
+            except (subprocess.SubprocessError, OSError):
+                pass
+            return None
+        
+        # macOS: lsof lists the listening process directly
+        if shutil.which('lsof'):
+            try:
+                result = subprocess.run(
+                    ['lsof', '-nP', f'-iTCP:{port}', '-sTCP:LISTEN', '-Fpc'],
+                    capture_output=True, text=True, timeout=1
+                )
+                fields = dict(
+                    (line[0], line[1:]) for line in result.stdout.splitlines() if line
+                )
+                if 'p' in fields and 'c' in fields:
+                    return fields['c'], int(fields['p'])
+            except (subprocess.SubprocessError, OSError, ValueError):
+                pass
+            return None
+        
+        # Fallback: scan processes with psutil
+        import psutil
+        
+        for proc in psutil.process_iter(['pid', 'name', 'connections']):
+            try:
+                for conn in proc.info['connections'] or []:
+                    if conn.laddr.port == port:
+                        return proc.info['name'], proc.info['pid']
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+        return None
+    
     def run_health_checks(self) -> bool:
-        """Run all health checks"""
+        """Run all health checks
+        
+        The Python version check runs first as a cheap gate; the remaining
+        checks are independent (network, filesystem, imports) and run
+        concurrently. Their output is buffered per check and printed in the
+        original order once all of them are done.
+        """
         print("🏥 Exécution des vérifications de santé...\n")
         
         checks = [
-            ("Version Python", self.check_python_version),
             ("Dépendances", self.check_dependencies),
             ("Base de données", self.check_database_connection),
             ("Service Ollama", self.check_ollama_service),
@@ -280,18 +427,44 @@ class StudyRAGStarter:
             ("Disponibilité du port", self.check_port_availability)
         ]
         
-        passed = 0
-        total = len(checks)
+        total = len(checks) + 1
         
-        for check_name, check_func in checks:
-            print(f"📋 {check_name}:")
-            try:
-                result = check_func()
-                if result:
-                    passed += 1
-                print()  # Empty line for readability
-            except Exception as e:
-                print(f"  ❌ Erreur inattendue: {e}\n")
+        print("📋 Version Python:")
+        try:
+            version_ok = self.check_python_version()
+        except Exception as e:
+            print(f"  ❌ Erreur inattendue: {e}")
+            version_ok = False
+        print()  # Empty line for readability
+        
+        if not version_ok:
+            print(f"📊 Résultat: 0/{total} vérifications réussies")
+            print("⚠️  Version Python incompatible, vérifications suivantes ignorées.")
+            return False
+        
+        passed = 1
+        real_stdout = sys.stdout
+        sys.stdout = _PerThreadStdout(real_stdout)
+        try:
+            with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+                futures = {
+                    check_name: executor.submit(_run_captured, check_func)
+                    for check_name, check_func in checks
+                }
+                results = [
+                    (check_name, *futures[check_name].result())
+                    for check_name, _ in checks
+                ]
+        finally:
+            sys.stdout = real_stdout
+        
+        # Build the whole report and write it at once
+        report = []
+        for check_name, result, output in results:
+            report.append(f"📋 {check_name}:\n{output}\n")  # Empty line for readability
+            if result:
+                passed += 1
+        sys.stdout.write("".join(report))
         
         print(f"📊 Résultat: {passed}/{total} vérifications réussies")
         
@@ -304,16 +477,19 @@ class StudyRAGStarter:
     
     def show_configuration(self):
         """Display current configuration"""
-        print("⚙️  Configuration actuelle:")
-        print(f"  🗄️  Base de données: {self.config['database_url']}")
-        print(f"  🤖 Ollama: {self.config['ollama_url']}")
-        print(f"  🧠 Modèle LLM: {self.config['llm_choice']}")
-        print(f"  📊 Embeddings: {self.config['embedding_model']}")
-        print(f"  🌐 Serveur: {self.config['host']}:{self.config['port']}")
-        print(f"  🐛 Debug: {self.config['debug']}")
+        lines = [
+            "⚙️  Configuration actuelle:",
+            f"  🗄️  Base de données: {self.config['database_url']}",
+            f"  🤖 Ollama: {self.config['ollama_url']}",
+            f"  🧠 Modèle LLM: {self.config['llm_choice']}",
+            f"  📊 Embeddings: {self.config['embedding_model']}",
+            f"  🌐 Serveur: {self.config['host']}:{self.config['port']}",
+            f"  🐛 Debug: {self.config['debug']}",
+        ]
         if self.config['openai_api_key']:
-            print(f"  🔑 OpenAI: Configuré (fallback)")
-        print()
+            lines.append("  🔑 OpenAI: Configuré (fallback)")
+        lines.append("")
+        print("\n".join(lines))
     
     def start_server(self):
         """Start the FastAPI server"""
@@ -349,7 +525,14 @@ class StudyRAGStarter:
         self.show_configuration()
         
         # Run health checks
-        if not self.run_health_checks():
+        try:
+            checks_ok = self.run_health_checks()
+        finally:
+            if self._http is not None:
+                self._http.close()
+                self._http = None
+        
+        if not checks_ok:
             print("\n❌ Impossible de démarrer à cause des erreurs ci-dessus.")
             print("💡 Corrigez les problèmes et relancez le script.")
             return 1
@@ -0,0 +1,46 @@
+"""Shared test fixtures."""
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture(scope="session")
+def chat_app():
+    """Create FastAPI app exposing the chat router, shared by the whole session."""
+    # Imported here so modules that never use the chat app don't pull in its services
+    from app.api.endpoints.chat import router
+    from app.core.exceptions import APIException
+
+    app = FastAPI()
+    app.include_router(router, prefix="/chat")
+
+    # Turn API errors into responses, as the full app does
+    @app.exception_handler(APIException)
+    async def api_exception_handler(request: Request, exc: APIException):
+        return JSONResponse(
+            status_code=exc.status_code,
+            content={"error_code": exc.error_code, "message": exc.message}
+        )
+
+    # Build the middleware stack up front rather than on the first request
+    app.middleware_stack = app.build_middleware_stack()
+    return app
+
+
+@pytest.fixture(scope="session")
+def chat_test_client(chat_app):
+    """Create synchronous test client for the shared chat app, entered once per session."""
+    with TestClient(chat_app) as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def chat_client(chat_app):
+    """Create ASGI test client for the shared chat app."""
+    transport = httpx.ASGITransport(app=chat_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
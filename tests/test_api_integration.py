@@ -1,178 +1,219 @@
 """Integration tests for FastAPI application."""
 
+import asyncio
+import threading
+
+import httpx
 import pytest
+import pytest_asyncio
 from unittest.mock import patch, AsyncMock, MagicMock
-from fastapi.testclient import TestClient
 
+from app.core.config import get_settings
 from app.main import create_app
 from app.services.health_service import HealthStatus
 
 
+# Default headers sent with every request, set once on the shared client
+CLIENT_HEADERS = {"User-Agent": "StudyRAG-Tests/1.0", "Accept": "application/json"}
+
+
+# Canned service responses, built once and shared by the mocked health tests
+HEALTHY_STATUS = {
+    "status": HealthStatus.HEALTHY,
+    "timestamp": "2024-01-01T00:00:00",
+    "version": "0.1.0",
+    "environment": "test",
+    "services": {
+        "chroma": {"status": HealthStatus.HEALTHY},
+        "ollama": {"status": HealthStatus.HEALTHY},
+        "embeddings": {"status": HealthStatus.HEALTHY},
+        "system": {"status": HealthStatus.HEALTHY}
+    }
+}
+
+UNHEALTHY_STATUS = {
+    "status": HealthStatus.UNHEALTHY,
+    "timestamp": "2024-01-01T00:00:00",
+    "version": "0.1.0",
+    "environment": "test",
+    "services": {
+        "chroma": {"status": HealthStatus.UNHEALTHY, "error": "Connection failed"},
+        "ollama": {"status": HealthStatus.UNHEALTHY, "error": "Service unavailable"},
+        "embeddings": {"status": HealthStatus.UNHEALTHY, "error": "Model not loaded"},
+        "system": {"status": HealthStatus.HEALTHY}
+    }
+}
+
+READY_STATUS = {
+    "ready": True,
+    "timestamp": "2024-01-01T00:00:00",
+    "services": {
+        "chroma": True,
+        "embeddings": True
+    }
+}
+
+NOT_READY_STATUS = {
+    "ready": False,
+    "timestamp": "2024-01-01T00:00:00",
+    "services": {
+        "chroma": False,
+        "embeddings": True
+    }
+}
+
+CHROMA_SERVICE_STATUS = {
+    "status": HealthStatus.HEALTHY,
+    "response_time": 0.1,
+    "url": "http://localhost:8001"
+}
+
+
+@pytest_asyncio.fixture(scope="class", loop_scope="class")
+async def client():
+    """Create ASGI test client shared across the requesting test class."""
+    app = create_app()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://test", headers=CLIENT_HEADERS
+    ) as client:
+        yield client
+
+
+@pytest.mark.asyncio(loop_scope="class")
 class TestAPIIntegration:
     """Test API integration and middleware."""
     
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        app = create_app()
-        return TestClient(app)
-    
-    def test_root_endpoint(self, client):
-        """Test root endpoint."""
-        response = client.get("/")
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert data["name"] == "StudyRAG API"
-        assert "version" in data
-        assert data["status"] == "running"
-    
-    def test_api_root_endpoint(self, client):
-        """Test API root endpoint."""
-        response = client.get("/api/v1/")
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert "StudyRAG API v1" in data["message"]
-        assert "version" in data
-        assert "endpoints" in data
-    
-    def test_api_status_endpoint(self, client):
-        """Test API status endpoint."""
-        response = client.get("/api/v1/status")
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert data["api_version"] == "v1"
-        assert "application_version" in data
-        assert "environment" in data
-        assert "services" in data
+    @pytest_asyncio.fixture(loop_scope="class")
+    async def debug_client(self):
+        """Create ASGI test client for an app built with DEBUG enabled."""
+        settings = get_settings().model_copy(update={"DEBUG": True})
+        with patch('app.main.get_settings', return_value=settings):
+            app = create_app()
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test", headers=CLIENT_HEADERS
+        ) as client:
+            yield client
     
-    def test_health_check_basic(self, client):
-        """Test basic health check endpoint."""
-        response = client.get("/health/")
+    @pytest.mark.parametrize("path,expected_values,expected_keys", [
+        pytest.param("/", {"name": "StudyRAG API", "status": "running"}, ("version",), id="root"),
+        pytest.param("/api/v1/", {"message": "StudyRAG API v1"}, ("version", "endpoints"), id="api-root"),
+        pytest.param("/api/v1/status", {"api_version": "v1"},
+                     ("application_version", "environment", "services"), id="api-status"),
+        pytest.param("/health/", {"status": "healthy", "message": "StudyRAG API is running"}, (),
+                     id="health-basic"),
+        pytest.param("/health/live", {"alive": True}, (), id="liveness"),
+    ])
+    async def test_basic_endpoint(self, client, path, expected_values, expected_keys):
+        """Test basic GET endpoints return their expected fields."""
+        response = await client.get(path)
         
         assert response.status_code == 200
         data = response.json()
-        assert data["status"] == "healthy"
-        assert data["message"] == "StudyRAG API is running"
-    
-    def test_liveness_check(self, client):
-        """Test liveness check endpoint."""
-        response = client.get("/health/live")
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert data["alive"] is True
+        for key, value in expected_values.items():
+            assert data[key] == value
+            assert type(data[key]) is type(value)
+        for key in expected_keys:
+            assert key in data
     
     @patch('app.services.health_service.HealthService.get_health_status')
-    def test_detailed_health_check_healthy(self, mock_health_status, client):
+    async def test_detailed_health_check_healthy(self, mock_health_status, client):
         """Test detailed health check when all services are healthy."""
-        mock_health_status.return_value = {
-            "status": HealthStatus.HEALTHY,
-            "timestamp": "2024-01-01T00:00:00",
-            "version": "0.1.0",
-            "environment": "test",
-            "services": {
-                "chroma": {"status": HealthStatus.HEALTHY},
-                "ollama": {"status": HealthStatus.HEALTHY},
-                "embeddings": {"status": HealthStatus.HEALTHY},
-                "system": {"status": HealthStatus.HEALTHY}
-            }
-        }
+        mock_health_status.return_value = HEALTHY_STATUS
         
-        response = client.get("/health/detailed")
+        response = await client.get("/health/detailed")
         
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == HealthStatus.HEALTHY
         assert "services" in data
+        assert mock_health_status.await_count == 1
     
     @patch('app.services.health_service.HealthService.get_health_status')
-    def test_detailed_health_check_unhealthy(self, mock_health_status, client):
+    async def test_detailed_health_check_unhealthy(self, mock_health_status, client):
         """Test detailed health check when services are unhealthy."""
-        mock_health_status.return_value = {
-            "status": HealthStatus.UNHEALTHY,
-            "timestamp": "2024-01-01T00:00:00",
-            "version": "0.1.0",
-            "environment": "test",
-            "services": {
-                "chroma": {"status": HealthStatus.UNHEALTHY, "error": "Connection failed"},
-                "ollama": {"status": HealthStatus.UNHEALTHY, "error": "Service unavailable"},
-                "embeddings": {"status": HealthStatus.UNHEALTHY, "error": "Model not loaded"},
-                "system": {"status": HealthStatus.HEALTHY}
-            }
-        }
+        mock_health_status.return_value = UNHEALTHY_STATUS
         
-        response = client.get("/health/detailed")
+        response = await client.get("/health/detailed")
         
         assert response.status_code == 503
         data = response.json()
         assert data["status"] == HealthStatus.UNHEALTHY
+        assert mock_health_status.await_count == 1
+    
+    @patch('app.services.health_service.HealthService._check_embedding_service_health')
+    @patch('app.services.health_service.HealthService._check_ollama_health')
+    @patch('app.services.health_service.HealthService._check_chroma_health')
+    async def test_slow_probe_does_not_block_liveness(self, mock_chroma, mock_ollama, mock_embedding, client):
+        """Test that a blocking health probe does not stall concurrent requests."""
+        for mock_check in (mock_chroma, mock_ollama, mock_embedding):
+            mock_check.return_value = {"status": HealthStatus.HEALTHY}
+        
+        release = threading.Event()
+        
+        def hanging_sample(psutil):
+            release.wait(timeout=5)
+            return 10.0, MagicMock(percent=10.0, available=0), MagicMock(percent=10.0, free=0)
+        
+        with patch('app.services.health_service.HealthService._sample_system_resources',
+                   side_effect=hanging_sample):
+            detailed = asyncio.ensure_future(client.get("/health/detailed?force_refresh=true"))
+            try:
+                response = await asyncio.wait_for(client.get("/health/live"), timeout=2)
+                
+                assert response.status_code == 200
+                assert not detailed.done()
+            finally:
+                release.set()
+            
+            assert (await detailed).status_code in [200, 503]
     
     @patch('app.services.health_service.HealthService.get_readiness_status')
-    def test_readiness_check_ready(self, mock_readiness_status, client):
+    async def test_readiness_check_ready(self, mock_readiness_status, client):
         """Test readiness check when service is ready."""
-        mock_readiness_status.return_value = {
-            "ready": True,
-            "timestamp": "2024-01-01T00:00:00",
-            "services": {
-                "chroma": True,
-                "embeddings": True
-            }
-        }
+        mock_readiness_status.return_value = READY_STATUS
         
-        response = client.get("/health/ready")
+        response = await client.get("/health/ready")
         
         assert response.status_code == 200
         data = response.json()
         assert data["ready"] is True
     
     @patch('app.services.health_service.HealthService.get_readiness_status')
-    def test_readiness_check_not_ready(self, mock_readiness_status, client):
+    async def test_readiness_check_not_ready(self, mock_readiness_status, client):
         """Test readiness check when service is not ready."""
-        mock_readiness_status.return_value = {
-            "ready": False,
-            "timestamp": "2024-01-01T00:00:00",
-            "services": {
-                "chroma": False,
-                "embeddings": True
-            }
-        }
+        mock_readiness_status.return_value = NOT_READY_STATUS
         
-        response = client.get("/health/ready")
+        response = await client.get("/health/ready")
         
         assert response.status_code == 503
         data = response.json()
         assert data["ready"] is False
     
     @patch('app.services.health_service.HealthService.check_service_connectivity')
-    def test_service_health_check(self, mock_service_check, client):
+    async def test_service_health_check(self, mock_service_check, client):
         """Test individual service health check."""
-        mock_service_check.return_value = {
-            "status": HealthStatus.HEALTHY,
-            "response_time": 0.1,
-            "url": "http://localhost:8001"
-        }
+        mock_service_check.return_value = CHROMA_SERVICE_STATUS
         
-        response = client.get("/health/service/chroma")
+        response = await client.get("/health/service/chroma")
         
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == HealthStatus.HEALTHY
         mock_service_check.assert_called_once_with("chroma")
     
-    def test_middleware_request_id_header(self, client):
+    async def test_middleware_request_id_header(self, client):
         """Test that request ID header is added by middleware."""
-        response = client.get("/")
+        response = await client.get("/")
         
         assert response.status_code == 200
         assert "X-Request-ID" in response.headers
         assert "X-Process-Time" in response.headers
     
-    def test_middleware_security_headers(self, client):
+    async def test_middleware_security_headers(self, client):
         """Test that security headers are added by middleware."""
-        response = client.get("/")
+        response = await client.get("/")
         
         assert response.status_code == 200
         assert response.headers["X-Content-Type-Options"] == "nosniff"
@@ -180,10 +221,10 @@ class TestAPIIntegration:
         assert response.headers["X-XSS-Protection"] == "1; mode=block"
         assert "Content-Security-Policy" in response.headers
     
-    def test_cors_headers(self, client):
+    async def test_cors_headers(self, client):
         """Test CORS headers."""
         # Preflight request
-        response = client.options(
+        response = await client.options(
             "/api/v1/",
             headers={
                 "Origin": "http://localhost:3000",
@@ -194,17 +235,17 @@ class TestAPIIntegration:
         assert response.status_code == 200
         assert "Access-Control-Allow-Origin" in response.headers
     
-    def test_custom_request_id_preserved(self, client):
+    async def test_custom_request_id_preserved(self, client):
         """Test that custom request ID is preserved."""
         custom_id = "test-request-123"
-        response = client.get("/", headers={"X-Request-ID": custom_id})
+        response = await client.get("/", headers={"X-Request-ID": custom_id})
         
         assert response.status_code == 200
         assert response.headers["X-Request-ID"] == custom_id
     
-    def test_404_error_handling(self, client):
+    async def test_404_error_handling(self, client):
         """Test 404 error handling."""
-        response = client.get("/nonexistent")
+        response = await client.get("/nonexistent")
         
         assert response.status_code == 404
         data = response.json()
@@ -212,58 +253,64 @@ class TestAPIIntegration:
         assert "message" in data
         assert "request_id" in data
     
-    def test_method_not_allowed_handling(self, client):
+    async def test_method_not_allowed_handling(self, client):
         """Test method not allowed handling."""
-        response = client.post("/")  # Root only accepts GET
+        response = await client.post("/")  # Root only accepts GET
         
         assert response.status_code == 405
         data = response.json()
         assert "error_code" in data
         assert "message" in data
     
-    def test_validation_error_handling(self, client):
+    async def test_validation_error_handling(self, client):
         """Test validation error handling."""
         # This would trigger validation error if we had endpoints with validation
         # For now, test with invalid query parameters
-        response = client.get("/health/detailed?force_refresh=invalid")
+        response = await client.get("/health/detailed?force_refresh=invalid")
         
         # Should still work as force_refresh is parsed as bool
         assert response.status_code in [200, 503]  # Depends on service health
     
-    def test_openapi_schema_in_debug_mode(self, client):
+    async def test_openapi_schema_in_debug_mode(self, debug_client):
         """Test OpenAPI schema availability in debug mode."""
-        with patch('app.core.config.get_settings') as mock_settings:
-            mock_settings.return_value.DEBUG = True
-            
-            response = client.get("/api/openapi.json")
-            
-            # Should be available in debug mode
-            assert response.status_code == 200
-            data = response.json()
-            assert "openapi" in data
-            assert "info" in data
+        response = await debug_client.get("/api/openapi.json")
+        
+        # Should be available in debug mode
+        assert response.status_code == 200
+        data = response.json()
+        assert "openapi" in data
+        assert "info" in data
     
-    def test_rate_limiting_not_applied_in_development(self, client):
+    async def test_rate_limiting_not_applied_in_development(self, client):
         """Test that rate limiting is not applied in development environment."""
-        # Make multiple requests quickly
-        for _ in range(10):
-            response = client.get("/")
-            assert response.status_code == 200
+        # Make multiple requests concurrently, each tagged with its own request ID
+        request_ids = [f"rate-limit-{i}" for i in range(11)]
+        responses = await asyncio.gather(*(
+            client.get("/", headers={"X-Request-ID": request_id})
+            for request_id in request_ids
+        ))
         
-        # Should not be rate limited in development
-        response = client.get("/")
-        assert response.status_code == 200
+        # Should not be rate limited in development, and no response is mixed up
+        for request_id, response in zip(request_ids, responses):
+            assert response.status_code == 200
+            assert response.headers["X-Request-ID"] == request_id
     
-    def test_health_endpoints_not_rate_limited(self, client):
+    async def test_health_endpoints_not_rate_limited(self, client):
         """Test that health endpoints are not rate limited."""
         # Even if rate limiting was enabled, health checks should work
-        for _ in range(10):
-            response = client.get("/health/")
+        request_ids = [f"health-{i}" for i in range(10)]
+        responses = await asyncio.gather(*(
+            client.get("/health/", headers={"X-Request-ID": request_id})
+            for request_id in request_ids
+        ))
+        
+        for request_id, response in zip(request_ids, responses):
             assert response.status_code == 200
+            assert response.headers["X-Request-ID"] == request_id
     
-    def test_error_response_format(self, client):
+    async def test_error_response_format(self, client):
         """Test error response format consistency."""
-        response = client.get("/nonexistent")
+        response = await client.get("/nonexistent")
         
         assert response.status_code == 404
         data = response.json()
@@ -278,9 +325,9 @@ class TestAPIIntegration:
         assert isinstance(data["message"], str)
         assert isinstance(data["request_id"], str)
     
-    def test_response_time_header(self, client):
+    async def test_response_time_header(self, client):
         """Test that response time header is present and valid."""
-        response = client.get("/")
+        response = await client.get("/")
         
         assert response.status_code == 200
         assert "X-Process-Time" in response.headers
@@ -289,23 +336,19 @@ class TestAPIIntegration:
         assert process_time >= 0
         assert process_time < 10  # Should be less than 10 seconds for simple request
     
-    def test_content_type_headers(self, client):
+    async def test_content_type_headers(self, client):
         """Test content type headers."""
-        response = client.get("/api/v1/")
+        response = await client.get("/api/v1/")
         
         assert response.status_code == 200
         assert response.headers["Content-Type"] == "application/json"
     
     @patch('app.services.health_service.HealthService.get_health_status')
-    def test_health_check_force_refresh(self, mock_health_status, client):
+    async def test_health_check_force_refresh(self, mock_health_status, client):
         """Test health check with force refresh parameter."""
-        mock_health_status.return_value = {
-            "status": HealthStatus.HEALTHY,
-            "timestamp": "2024-01-01T00:00:00",
-            "services": {}
-        }
+        mock_health_status.return_value = HEALTHY_STATUS
         
-        response = client.get("/health/detailed?force_refresh=true")
+        response = await client.get("/health/detailed?force_refresh=true")
         
         assert response.status_code == 200
         mock_health_status.assert_called_once_with(force_refresh=True)
\ No newline at end of file
@@ -1,65 +1,124 @@
 """Tests for chat API endpoints."""
 
 import pytest
+import asyncio
+import inspect
 import json
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, call
 from datetime import datetime
 from typing import Dict, Any
 
-from fastapi.testclient import TestClient
-from fastapi import FastAPI
 
 from app.models.chat import (
     ChatRequest, ChatResponse, ChatMessage, Conversation, MessageRole,
-    ConversationStatus, ConversationCreateRequest, StreamingChatResponse
+    ConversationStatus, ConversationCreateRequest, StreamingChatResponse,
+    ConversationListResponse, ConversationMessagesResponse
 )
 from app.models.search import SearchResult, SearchResponse
 from app.services.chat_engine import ChatEngine
 from app.services.conversation_manager import ConversationManager, ConversationNotFoundError
-from app.api.endpoints.chat import router
+from app.api.endpoints.chat import (
+    send_chat_message, list_conversations, ChatAPIError, WebSocketManager
+)
 from app.core.dependencies import get_chat_engine, get_conversation_manager
 
 
-@pytest.fixture
-def app():
-    """Create test FastAPI app."""
-    app = FastAPI()
-    app.include_router(router, prefix="/chat")
-    return app
+# Chat request body sent as pre-encoded JSON so it is serialized only once
+HELLO_PAYLOAD = {
+    "message": "Hello, world!",
+    "conversation_id": "conv-123",
+    "include_sources": True
+}
+HELLO_PAYLOAD_JSON = json.dumps(HELLO_PAYLOAD).encode()
+JSON_HEADERS = {"content-type": "application/json"}
 
+# Static property of the endpoint, checked once at import
+_SEND_IS_ASYNC = inspect.iscoroutinefunction(send_chat_message)
 
-@pytest.fixture
-def client(app):
-    """Create test client."""
-    return TestClient(app)
+# Streamed reply chunks, validated once and replayed by _mock_stream()
+_STREAM_CHUNKS = (
+    StreamingChatResponse(
+        conversation_id="conv-123",
+        message_id="msg-123",
+        content_delta="Hello",
+        is_complete=False
+    ),
+    StreamingChatResponse(
+        conversation_id="conv-123",
+        message_id="msg-123",
+        content_delta=" world!",
+        is_complete=True
+    ),
+)
+
+
+async def _mock_stream():
+    for chunk in _STREAM_CHUNKS:
+        yield chunk
+
+
+@pytest.fixture(autouse=True)
+def _reset_overrides(chat_app):
+    """Drop dependency overrides set by a test once it finishes."""
+    yield
+    chat_app.dependency_overrides.clear()
+
+
+class FakeWS:
+    """Minimal WebSocket stand-in recording the text frames it is sent."""
+    
+    __slots__ = ("sent",)
+    
+    def __init__(self):
+        self.sent = []
+    
+    async def accept(self):
+        pass
+    
+    async def send_text(self, data):
+        self.sent.append(data)
+
+
+# Spec'd mocks are built once at import; fixtures hand them out reset
+_CHAT_ENGINE_TEMPLATE = AsyncMock(spec=ChatEngine)
+_CONVERSATION_MANAGER_TEMPLATE = AsyncMock(spec=ConversationManager)
 
 
 @pytest.fixture
 def mock_chat_engine():
     """Mock chat engine."""
-    return AsyncMock(spec=ChatEngine)
+    _CHAT_ENGINE_TEMPLATE.reset_mock(return_value=True, side_effect=True)
+    return _CHAT_ENGINE_TEMPLATE
 
 
 @pytest.fixture
 def mock_conversation_manager():
     """Mock conversation manager."""
-    return AsyncMock(spec=ConversationManager)
+    _CONVERSATION_MANAGER_TEMPLATE.reset_mock(return_value=True, side_effect=True)
+    return _CONVERSATION_MANAGER_TEMPLATE
 
 
 @pytest.fixture
+def websocket_manager():
+    """Create WebSocket manager for testing."""
+    return WebSocketManager()
+
+
+@pytest.fixture(scope="module")
 def sample_conversation():
     """Sample conversation for testing."""
-    return Conversation(
+    # Known-good data, so skip validation
+    return Conversation.model_construct(
         id="conv-123",
         title="Test Conversation",
         status=ConversationStatus.ACTIVE,
         message_count=2,
-        last_message_at=datetime.now(),
+        last_message_at=datetime(2024, 1, 1),
         model_name="llama2"
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_message():
     """Sample chat message for testing."""
     return ChatMessage(
@@ -72,7 +131,7 @@ def sample_message():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_chat_response(sample_message, sample_conversation):
     """Sample chat response for testing."""
     return ChatResponse(
@@ -86,45 +145,30 @@ def sample_chat_response(sample_message, sample_conversation):
 class TestChatMessageEndpoint:
     """Test chat message endpoint."""
     
-    async def test_send_chat_message_success(self, client, mock_chat_engine, sample_chat_response):
+    async def test_send_chat_message_success(self, chat_app, chat_client, mock_chat_engine, sample_chat_response):
         """Test successful chat message sending."""
         mock_chat_engine.process_message.return_value = sample_chat_response
         
-        # Override the dependency
-        def override_get_chat_engine():
-            return mock_chat_engine
-        
-        client.app.dependency_overrides[get_chat_engine] = override_get_chat_engine
-        
-        try:
-            request_data = {
-                "message": "Hello, world!",
-                "conversation_id": "conv-123",
-                "include_sources": True
-            }
-            
-            response = client.post("/chat/message", json=request_data)
-            
-            assert response.status_code == 200
-            data = response.json()
-            assert data["message"]["content"] == "Hello, how can I help you?"
-            assert data["conversation"]["id"] == "conv-123"
-            assert "generation_stats" in data
-            
-            # Verify chat engine was called correctly
-            mock_chat_engine.process_message.assert_called_once()
-            call_args = mock_chat_engine.process_message.call_args[0][0]
-            assert isinstance(call_args, ChatRequest)
-            assert call_args.message == "Hello, world!"
-            assert call_args.conversation_id == "conv-123"
-        finally:
-            # Clean up dependency override
-            client.app.dependency_overrides.clear()
+        chat_app.dependency_overrides[get_chat_engine] = lambda: mock_chat_engine
+        
+        response = await chat_client.post("/chat/message", content=HELLO_PAYLOAD_JSON, headers=JSON_HEADERS)
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["message"]["content"] == "Hello, how can I help you?"
+        assert data["conversation"]["id"] == "conv-123"
+        assert "generation_stats" in data
+        
+        # Verify chat engine was called correctly
+        mock_chat_engine.process_message.assert_called_once()
+        call_args = mock_chat_engine.process_message.call_args[0][0]
+        assert isinstance(call_args, ChatRequest)
+        assert call_args.message == HELLO_PAYLOAD["message"]
+        assert call_args.conversation_id == HELLO_PAYLOAD["conversation_id"]
     
-    @patch('app.api.endpoints.chat.get_chat_engine')
-    async def test_send_chat_message_new_conversation(self, mock_get_engine, client, mock_chat_engine, sample_chat_response):
+    async def test_send_chat_message_new_conversation(self, chat_app, chat_client, mock_chat_engine, sample_chat_response):
         """Test sending message without conversation ID (new conversation)."""
-        mock_get_engine.return_value = mock_chat_engine
+        chat_app.dependency_overrides[get_chat_engine] = lambda: mock_chat_engine
         mock_chat_engine.process_message.return_value = sample_chat_response
         
         request_data = {
@@ -132,79 +176,51 @@ class TestChatMessageEndpoint:
             "model_name": "llama2"
         }
         
-        response = client.post("/chat/message", json=request_data)
+        response = await chat_client.post("/chat/message", json=request_data)
         
         assert response.status_code == 200
-        data = response.json()
-        assert data["message"]["content"] == "Hello, how can I help you?"
+        assert b'"content":"Hello, how can I help you?"' in response.content
         
         # Verify request was processed correctly
         call_args = mock_chat_engine.process_message.call_args[0][0]
         assert call_args.conversation_id is None
         assert call_args.model_name == "llama2"
     
-    @patch('app.api.endpoints.chat.get_chat_engine')
-    async def test_send_chat_message_validation_error(self, mock_get_engine, client):
+    @pytest.mark.parametrize("payload", [
+        {"message": ""},
+        {"message": "x" * 5001},
+        {"message": "test", "max_context_tokens": 50},
+    ], ids=["empty-message", "message-too-long", "max-context-tokens-too-low"])
+    async def test_send_chat_message_validation_error(self, chat_app, chat_client, payload):
         """Test chat message validation errors."""
-        mock_get_engine.return_value = AsyncMock()
-        
-        # Empty message
-        response = client.post("/chat/message", json={"message": ""})
-        assert response.status_code == 422
-        
-        # Message too long
-        long_message = "x" * 5001
-        response = client.post("/chat/message", json={"message": long_message})
-        assert response.status_code == 422
+        chat_app.dependency_overrides[get_chat_engine] = lambda: AsyncMock()
         
-        # Invalid max_context_tokens
-        response = client.post("/chat/message", json={
-            "message": "test",
-            "max_context_tokens": 50  # Too low
-        })
+        response = await chat_client.post("/chat/message", json=payload)
         assert response.status_code == 422
     
-    @patch('app.api.endpoints.chat.get_chat_engine')
-    async def test_send_chat_message_engine_error(self, mock_get_engine, client, mock_chat_engine):
+    async def test_send_chat_message_engine_error(self, chat_app, chat_client, mock_chat_engine):
         """Test chat engine error handling."""
-        mock_get_engine.return_value = mock_chat_engine
+        chat_app.dependency_overrides[get_chat_engine] = lambda: mock_chat_engine
         mock_chat_engine.process_message.side_effect = Exception("Engine error")
         
         request_data = {"message": "Hello"}
         
-        response = client.post("/chat/message", json=request_data)
+        response = await chat_client.post("/chat/message", json=request_data)
         
         assert response.status_code == 400
-        data = response.json()
-        assert "Failed to process chat message" in data["message"]
+        assert b"Failed to process chat message" in response.content
 
 
 class TestStreamingEndpoint:
     """Test streaming chat endpoint."""
     
-    @patch('app.api.endpoints.chat.get_chat_engine')
-    async def test_stream_chat_message(self, mock_get_engine, client, mock_chat_engine):
+    async def test_stream_chat_message(self, chat_app, chat_client, mock_chat_engine):
         """Test streaming chat response."""
-        mock_get_engine.return_value = mock_chat_engine
-        
-        # Mock streaming response
-        async def mock_stream():
-            yield StreamingChatResponse(
-                conversation_id="conv-123",
-                message_id="msg-123",
-                content_delta="Hello",
-                is_complete=False
-            )
-            yield StreamingChatResponse(
-                conversation_id="conv-123",
-                message_id="msg-123",
-                content_delta=" world!",
-                is_complete=True
-            )
+        chat_app.dependency_overrides[get_chat_engine] = lambda: mock_chat_engine
         
-        mock_chat_engine.stream_message.return_value = mock_stream()
+        mock_chat_engine.stream_message.return_value = _mock_stream()
         
-        response = client.get("/chat/stream/conv-123?message=Hello")
+        response = await chat_client.get("/chat/stream/conv-123?message=Hello")
         
         assert response.status_code == 200
         assert response.headers["content-type"] == "text/event-stream; charset=utf-8"
@@ -216,39 +232,81 @@ class TestStreamingEndpoint:
 class TestConversationEndpoints:
     """Test conversation management endpoints."""
     
-    @patch('app.api.endpoints.chat.get_conversation_manager')
-    async def test_list_conversations(self, mock_get_manager, client, mock_conversation_manager, sample_conversation):
-        """Test listing conversations."""
-        from app.models.chat import ConversationListResponse
-        
-        mock_get_manager.return_value = mock_conversation_manager
-        mock_conversation_manager.list_conversations.return_value = ConversationListResponse(
-            conversations=[sample_conversation],
-            total=1
-        )
-        
-        response = client.get("/chat/conversations")
+    @pytest.mark.parametrize("path,manager_method,build_result,expected_call,expected_fields,items", [
+        (
+            "/chat/conversations",
+            "list_conversations",
+            lambda conversation, message: ConversationListResponse(
+                conversations=[conversation], total=1
+            ),
+            call(status=None, limit=50, offset=0),
+            {"total": 1},
+            ("conversations", "conv-123"),
+        ),
+        (
+            "/chat/conversations?status=active&limit=10&offset=0",
+            "list_conversations",
+            lambda conversation, message: ConversationListResponse(
+                conversations=[conversation], total=1
+            ),
+            call(status=ConversationStatus.ACTIVE, limit=10, offset=0),
+            {"total": 1},
+            ("conversations", "conv-123"),
+        ),
+        (
+            "/chat/conversations/conv-123",
+            "get_conversation",
+            lambda conversation, message: conversation,
+            call("conv-123"),
+            {"id": "conv-123", "title": "Test Conversation"},
+            None,
+        ),
+        (
+            "/chat/conversations/conv-123/messages",
+            "get_messages",
+            lambda conversation, message: ConversationMessagesResponse(
+                conversation=conversation, messages=[message], total_messages=1
+            ),
+            call(conversation_id="conv-123", limit=100, offset=0),
+            {"total_messages": 1},
+            ("messages", "msg-123"),
+        ),
+        (
+            "/chat/conversations/conv-123/messages?limit=50&offset=10",
+            "get_messages",
+            lambda conversation, message: ConversationMessagesResponse(
+                conversation=conversation, messages=[message], total_messages=1
+            ),
+            call(conversation_id="conv-123", limit=50, offset=10),
+            {"total_messages": 1},
+            ("messages", "msg-123"),
+        ),
+    ], ids=["list", "list-filtered", "get", "messages", "messages-paginated"])
+    async def test_read_conversation_endpoint(
+        self, chat_app, chat_client, mock_conversation_manager, sample_conversation, sample_message,
+        path, manager_method, build_result, expected_call, expected_fields, items
+    ):
+        """Test conversation read endpoints forward their query and return the manager result."""
+        chat_app.dependency_overrides[get_conversation_manager] = lambda: mock_conversation_manager
+        method = getattr(mock_conversation_manager, manager_method)
+        method.return_value = build_result(sample_conversation, sample_message)
+        
+        response = await chat_client.get(path)
         
         assert response.status_code == 200
         data = response.json()
-        assert data["total"] == 1
-        assert len(data["conversations"]) == 1
-        assert data["conversations"][0]["id"] == "conv-123"
-        
-        # Test with filters
-        response = client.get("/chat/conversations?status=active&limit=10&offset=0")
-        assert response.status_code == 200
-        
-        mock_conversation_manager.list_conversations.assert_called_with(
-            status=ConversationStatus.ACTIVE,
-            limit=10,
-            offset=0
-        )
+        for key, value in expected_fields.items():
+            assert data[key] == value
+        if items is not None:
+            items_key, first_id = items
+            assert len(data[items_key]) == 1
+            assert data[items_key][0]["id"] == first_id
+        
+        assert method.call_args_list == [expected_call]
     
-    @patch('app.api.endpoints.chat.get_conversation_manager')
-    async def test_create_conversation(self, mock_get_manager, client, mock_conversation_manager, sample_conversation):
+    async def test_create_conversation(self, chat_app, chat_client, mock_conversation_manager, sample_conversation):
         """Test creating a new conversation."""
-        mock_get_manager.return_value = mock_conversation_manager
+        chat_app.dependency_overrides[get_conversation_manager] = lambda: mock_conversation_manager
         mock_conversation_manager.create_conversation.return_value = sample_conversation
         
         request_data = {
@@ -257,7 +315,7 @@ class TestConversationEndpoints:
             "system_prompt": "You are a helpful assistant"
         }
         
-        response = client.post("/chat/conversations", json=request_data)
+        response = await chat_client.post("/chat/conversations", json=request_data)
         
         assert response.status_code == 200
         data = response.json()
@@ -271,77 +329,28 @@ class TestConversationEndpoints:
         assert call_args.title == "New Conversation"
         assert call_args.model_name == "llama2"
     
-    @patch('app.api.endpoints.chat.get_conversation_manager')
-    async def test_get_conversation(self, mock_get_manager, client, mock_conversation_manager, sample_conversation):
-        """Test getting a specific conversation."""
-        mock_get_manager.return_value = mock_conversation_manager
-        mock_conversation_manager.get_conversation.return_value = sample_conversation
-        
-        response = client.get("/chat/conversations/conv-123")
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert data["id"] == "conv-123"
-        assert data["title"] == "Test Conversation"
-        
-        mock_conversation_manager.get_conversation.assert_called_once_with("conv-123")
-    
-    @patch('app.api.endpoints.chat.get_conversation_manager')
-    async def test_get_conversation_not_found(self, mock_get_manager, client, mock_conversation_manager):
+    async def test_get_conversation_not_found(self, chat_app, chat_client, mock_conversation_manager):
         """Test getting non-existent conversation."""
-        mock_get_manager.return_value = mock_conversation_manager
+        chat_app.dependency_overrides[get_conversation_manager] = lambda: mock_conversation_manager
         mock_conversation_manager.get_conversation.side_effect = ConversationNotFoundError("conv-999")
         
-        response = client.get("/chat/conversations/conv-999")
+        response = await chat_client.get("/chat/conversations/conv-999")
         
         assert response.status_code == 404
-        data = response.json()
-        assert "not found" in data["detail"]
+        assert b"not found" in response.content
     
-    @patch('app.api.endpoints.chat.get_conversation_manager')
-    async def test_get_conversation_messages(self, mock_get_manager, client, mock_conversation_manager, sample_conversation, sample_message):
-        """Test getting conversation messages."""
-        from app.models.chat import ConversationMessagesResponse
-        
-        mock_get_manager.return_value = mock_conversation_manager
-        mock_conversation_manager.get_messages.return_value = ConversationMessagesResponse(
-            conversation=sample_conversation,
-            messages=[sample_message],
-            total_messages=1
-        )
-        
-        response = client.get("/chat/conversations/conv-123/messages")
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert data["total_messages"] == 1
-        assert len(data["messages"]) == 1
-        assert data["messages"][0]["id"] == "msg-123"
-        
-        # Test with pagination
-        response = client.get("/chat/conversations/conv-123/messages?limit=50&offset=10")
-        assert response.status_code == 200
-        
-        mock_conversation_manager.get_messages.assert_called_with(
-            conversation_id="conv-123",
-            limit=50,
-            offset=10
-        )
-    
-    @patch('app.api.endpoints.chat.get_conversation_manager')
-    async def test_update_conversation(self, mock_get_manager, client, mock_conversation_manager, sample_conversation):
+    async def test_update_conversation(self, chat_app, chat_client, mock_conversation_manager, sample_conversation):
         """Test updating conversation details."""
-        mock_get_manager.return_value = mock_conversation_manager
+        chat_app.dependency_overrides[get_conversation_manager] = lambda: mock_conversation_manager
         
         updated_conversation = sample_conversation.model_copy()
         updated_conversation.title = "Updated Title"
         mock_conversation_manager.update_conversation.return_value = updated_conversation
         
-        response = client.put("/chat/conversations/conv-123?title=Updated Title&status=active")
+        response = await chat_client.put("/chat/conversations/conv-123?title=Updated Title&status=active")
         
         assert response.status_code == 200
-        data = response.json()
-        assert data["title"] == "Updated Title"
+        assert b'"title":"Updated Title"' in response.content
         
         mock_conversation_manager.update_conversation.assert_called_once_with(
             conversation_id="conv-123",
@@ -351,41 +360,36 @@ class TestConversationEndpoints:
             system_prompt=None
         )
     
-    @patch('app.api.endpoints.chat.get_conversation_manager')
-    async def test_delete_conversation(self, mock_get_manager, client, mock_conversation_manager):
+    async def test_delete_conversation(self, chat_app, chat_client, mock_conversation_manager):
         """Test deleting a conversation."""
-        mock_get_manager.return_value = mock_conversation_manager
+        chat_app.dependency_overrides[get_conversation_manager] = lambda: mock_conversation_manager
         mock_conversation_manager.delete_conversation.return_value = True
         
-        response = client.delete("/chat/conversations/conv-123")
+        response = await chat_client.delete("/chat/conversations/conv-123")
         
         assert response.status_code == 200
-        data = response.json()
-        assert "deleted successfully" in data["message"]
-        assert data["conversation_id"] == "conv-123"
+        assert b"deleted successfully" in response.content
+        assert b'"conversation_id":"conv-123"' in response.content
         
         mock_conversation_manager.delete_conversation.assert_called_once_with("conv-123")
     
-    @patch('app.api.endpoints.chat.get_conversation_manager')
-    async def test_delete_conversation_not_found(self, mock_get_manager, client, mock_conversation_manager):
+    async def test_delete_conversation_not_found(self, chat_app, chat_client, mock_conversation_manager):
         """Test deleting non-existent conversation."""
-        mock_get_manager.return_value = mock_conversation_manager
+        chat_app.dependency_overrides[get_conversation_manager] = lambda: mock_conversation_manager
         mock_conversation_manager.delete_conversation.return_value = False
         
-        response = client.delete("/chat/conversations/conv-999")
+        response = await chat_client.delete("/chat/conversations/conv-999")
         
         assert response.status_code == 404
-        data = response.json()
-        assert "not found" in data["detail"]
+        assert b"not found" in response.content
 
 
 class TestChatStats:
     """Test chat statistics endpoint."""
     
-    @patch('app.api.endpoints.chat.get_conversation_manager')
-    async def test_get_chat_stats(self, mock_get_manager, client, mock_conversation_manager):
+    async def test_get_chat_stats(self, chat_app, chat_client, mock_conversation_manager):
         """Test getting chat statistics."""
-        mock_get_manager.return_value = mock_conversation_manager
+        chat_app.dependency_overrides[get_conversation_manager] = lambda: mock_conversation_manager
         mock_conversation_manager.get_conversation_stats.return_value = {
             "total_conversations": 10,
             "active_conversations": 8,
@@ -394,7 +398,7 @@ class TestChatStats:
             "model_usage": {"llama2": 5, "mistral": 3}
         }
         
-        response = client.get("/chat/stats")
+        response = await chat_client.get("/chat/stats")
         
         assert response.status_code == 200
         data = response.json()
@@ -407,100 +411,81 @@ class TestChatStats:
 class TestWebSocketManager:
     """Test WebSocket manager functionality."""
     
-    def test_websocket_manager_initialization(self):
+    def test_websocket_manager_initialization(self, websocket_manager):
         """Test WebSocket manager initialization."""
-        from app.api.endpoints.chat import WebSocketManager
-        
-        manager = WebSocketManager()
-        assert manager.active_connections == {}
-        assert manager.connection_metadata == {}
+        assert websocket_manager.active_connections == {}
+        assert websocket_manager.connection_metadata == {}
     
-    async def test_websocket_connect_disconnect(self):
+    async def test_websocket_connect_disconnect(self, websocket_manager):
         """Test WebSocket connection and disconnection."""
-        from app.api.endpoints.chat import WebSocketManager
-        
-        manager = WebSocketManager()
-        mock_websocket = MagicMock()
-        mock_websocket.accept = AsyncMock()
+        mock_websocket = FakeWS()
         
         # Test connection
-        await manager.connect(mock_websocket, "conv-123", "client-1")
+        await websocket_manager.connect(mock_websocket, "conv-123", "client-1")
         
-        assert "conv-123" in manager.active_connections
-        assert mock_websocket in manager.active_connections["conv-123"]
-        assert mock_websocket in manager.connection_metadata
+        assert "conv-123" in websocket_manager.active_connections
+        assert mock_websocket in websocket_manager.active_connections["conv-123"]
+        assert mock_websocket in websocket_manager.connection_metadata
         
         # Test disconnection
-        manager.disconnect(mock_websocket)
+        websocket_manager.disconnect(mock_websocket)
         
-        assert "conv-123" not in manager.active_connections
-        assert mock_websocket not in manager.connection_metadata
+        assert "conv-123" not in websocket_manager.active_connections
+        assert mock_websocket not in websocket_manager.connection_metadata
     
-    async def test_websocket_send_to_conversation(self):
+    async def test_websocket_send_to_conversation(self, websocket_manager):
         """Test sending messages to conversation."""
-        from app.api.endpoints.chat import WebSocketManager
-        
-        manager = WebSocketManager()
-        mock_websocket1 = MagicMock()
-        mock_websocket2 = MagicMock()
-        
-        mock_websocket1.accept = AsyncMock()
-        mock_websocket2.accept = AsyncMock()
-        mock_websocket1.send_text = AsyncMock()
-        mock_websocket2.send_text = AsyncMock()
+        mock_websocket1 = FakeWS()
+        mock_websocket2 = FakeWS()
         
         # Connect two clients to same conversation
-        await manager.connect(mock_websocket1, "conv-123", "client-1")
-        await manager.connect(mock_websocket2, "conv-123", "client-2")
+        await websocket_manager.connect(mock_websocket1, "conv-123", "client-1")
+        await websocket_manager.connect(mock_websocket2, "conv-123", "client-2")
         
         # Send message to conversation
         message = {"type": "test", "data": "hello"}
-        await manager.send_to_conversation("conv-123", message)
+        await websocket_manager.send_to_conversation("conv-123", message)
         
         # Both clients should receive the message
-        mock_websocket1.send_text.assert_called_once_with(json.dumps(message))
-        mock_websocket2.send_text.assert_called_once_with(json.dumps(message))
+        assert [json.loads(frame) for frame in mock_websocket1.sent] == [message]
+        assert [json.loads(frame) for frame in mock_websocket2.sent] == [message]
 
 
 class TestErrorHandling:
     """Test error handling in chat endpoints."""
     
-    @patch('app.api.endpoints.chat.get_chat_engine')
-    async def test_chat_engine_unavailable(self, mock_get_engine, client):
+    async def test_chat_engine_unavailable(self, mock_chat_engine):
         """Test handling when chat engine is unavailable."""
-        mock_get_engine.side_effect = Exception("Service unavailable")
-        
-        response = client.post("/chat/message", json={"message": "test"})
+        mock_chat_engine.process_message.side_effect = Exception("Service unavailable")
         
-        # Should handle the dependency injection error gracefully
-        assert response.status_code in [500, 503]
+        # Call the endpoint directly; routing adds nothing to this error path
+        with pytest.raises(ChatAPIError, match="Service unavailable"):
+            await send_chat_message(ChatRequest(message="test"), chat_engine=mock_chat_engine)
     
-    @patch('app.api.endpoints.chat.get_conversation_manager')
-    async def test_conversation_manager_error(self, mock_get_manager, client):
+    async def test_conversation_manager_error(self, mock_conversation_manager):
         """Test handling conversation manager errors."""
-        mock_get_manager.side_effect = Exception("Database error")
+        mock_conversation_manager.list_conversations.side_effect = Exception("Database error")
         
-        response = client.get("/chat/conversations")
-        
-        # Should handle the dependency injection error gracefully
-        assert response.status_code in [500, 503]
+        with pytest.raises(ChatAPIError, match="Database error"):
+            await list_conversations(
+                status=None, limit=50, offset=0,
+                conversation_manager=mock_conversation_manager
+            )
     
-    async def test_invalid_conversation_id_format(self, client):
+    async def test_invalid_conversation_id_format(self, chat_app, chat_client):
         """Test handling invalid conversation ID formats."""
         # This would be handled by FastAPI's path validation
         # Testing with a very long ID that might cause issues
         long_id = "x" * 1000
         
-        with patch('app.api.endpoints.chat.get_conversation_manager') as mock_get_manager:
-            mock_manager = AsyncMock()
-            mock_get_manager.return_value = mock_manager
-            mock_manager.get_conversation.side_effect = ConversationNotFoundError(long_id)
-            
-            response = client.get(f"/chat/conversations/{long_id}")
-            assert response.status_code == 404
+        mock_manager = AsyncMock()
+        mock_manager.get_conversation.side_effect = ConversationNotFoundError(long_id)
+        chat_app.dependency_overrides[get_conversation_manager] = lambda: mock_manager
+        
+        response = await chat_client.get(f"/chat/conversations/{long_id}")
+        assert response.status_code == 404
 
 
-@pytest.mark.asyncio
 class TestAsyncEndpoints:
     """Test async functionality of endpoints."""
     
@@ -508,30 +493,23 @@ class TestAsyncEndpoints:
         """Test handling concurrent message processing."""
         # This would test the actual async behavior
         # For now, we'll test that the endpoints are properly async
-        from app.api.endpoints.chat import send_chat_message
         
         # Verify the function is async
-        import inspect
-        assert inspect.iscoroutinefunction(send_chat_message)
+        assert _SEND_IS_ASYNC
     
-    async def test_websocket_concurrent_connections(self):
+    async def test_websocket_concurrent_connections(self, websocket_manager):
         """Test handling multiple concurrent WebSocket connections."""
-        from app.api.endpoints.chat import WebSocketManager
-        
-        manager = WebSocketManager()
-        
         # Simulate multiple concurrent connections
-        mock_websockets = []
-        for i in range(5):
-            mock_ws = MagicMock()
-            mock_ws.accept = AsyncMock()
-            mock_websockets.append(mock_ws)
-            await manager.connect(mock_ws, "conv-123", f"client-{i}")
+        mock_websockets = [FakeWS() for _ in range(5)]
+        await asyncio.gather(*(
+            websocket_manager.connect(ws, "conv-123", f"client-{i}")
+            for i, ws in enumerate(mock_websockets)
+        ))
         
-        assert len(manager.active_connections["conv-123"]) == 5
+        assert len(websocket_manager.active_connections["conv-123"]) == 5
         
         # Disconnect all
         for ws in mock_websockets:
-            manager.disconnect(ws)
+            websocket_manager.disconnect(ws)
         
-        assert "conv-123" not in manager.active_connections
\ No newline at end of file
+        assert "conv-123" not in websocket_manager.active_connections
\ No newline at end of file
@@ -1,40 +1,75 @@
 """Simple tests for chat API endpoints."""
 
+import httpx
 import pytest
+import pytest_asyncio
 import json
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 from datetime import datetime
 
-from fastapi.testclient import TestClient
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from pydantic import ValidationError
 
 from app.models.chat import (
     ChatRequest, ChatResponse, ChatMessage, Conversation, MessageRole,
     ConversationStatus, ConversationCreateRequest
 )
 from app.api.endpoints.chat import router
+from app.core.exceptions import APIException
 from app.core.dependencies import get_chat_engine, get_conversation_manager
-from app.services.conversation_manager import ConversationNotFoundError
+from app.services.chat_engine import ChatEngine
+from app.services.conversation_manager import ConversationManager, ConversationNotFoundError
 
+# Fixed request bodies sent as pre-encoded JSON so they are serialized only once
+CHAT_MESSAGE_JSON = json.dumps({
+    "message": "Hello, world!",
+    "conversation_id": "conv-123",
+    "include_sources": True
+}).encode()
+CREATE_CONVERSATION_JSON = json.dumps({
+    "title": "New Conversation",
+    "model_name": "llama2"
+}).encode()
+JSON_HEADERS = {"content-type": "application/json"}
 
-@pytest.fixture
+# Just over the ChatRequest.message max_length of 5000
+LONG_MESSAGE_PAYLOAD = {"message": "x" * 5001}
+
+
+@pytest.fixture(scope="module")
 def mock_chat_engine():
     """Mock chat engine."""
-    return AsyncMock()
+    return AsyncMock(spec=ChatEngine)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_conversation_manager():
     """Mock conversation manager."""
-    return AsyncMock()
+    return AsyncMock(spec=ConversationManager)
+
+
+@pytest.fixture(autouse=True)
+def _reset_mocks(mock_chat_engine, mock_conversation_manager):
+    """Reset the shared mocks before each test."""
+    mock_chat_engine.reset_mock(return_value=True, side_effect=True)
+    mock_conversation_manager.reset_mock(return_value=True, side_effect=True)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def app_with_mocks(mock_chat_engine, mock_conversation_manager):
     """Create test app with mocked dependencies."""
     app = FastAPI()
     app.include_router(router, prefix="/chat")
     
+    # Turn API errors into responses, as the full app does
+    @app.exception_handler(APIException)
+    async def api_exception_handler(request: Request, exc: APIException):
+        return JSONResponse(
+            status_code=exc.status_code,
+            content={"error_code": exc.error_code, "message": exc.message}
+        )
+    
     # Override dependencies
     app.dependency_overrides[get_chat_engine] = lambda: mock_chat_engine
     app.dependency_overrides[get_conversation_manager] = lambda: mock_conversation_manager
@@ -42,13 +77,15 @@ def app_with_mocks(mock_chat_engine, mock_conversation_manager):
     return app
 
 
-@pytest.fixture
-def client(app_with_mocks):
-    """Create test client with mocked dependencies."""
-    return TestClient(app_with_mocks)
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def client(app_with_mocks):
+    """Create ASGI test client with mocked dependencies."""
+    transport = httpx.ASGITransport(app=app_with_mocks)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_conversation():
     """Sample conversation for testing."""
     return Conversation(
@@ -56,12 +93,12 @@ def sample_conversation():
         title="Test Conversation",
         status=ConversationStatus.ACTIVE,
         message_count=2,
-        last_message_at=datetime.now(),
+        last_message_at=datetime(2024, 1, 1),
         model_name="llama2"
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_message():
     """Sample chat message for testing."""
     return ChatMessage(
@@ -74,7 +111,7 @@ def sample_message():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_chat_response(sample_message, sample_conversation):
     """Sample chat response for testing."""
     return ChatResponse(
@@ -88,17 +125,11 @@ def sample_chat_response(sample_message, sample_conversation):
 class TestChatMessageEndpoint:
     """Test chat message endpoint."""
     
-    def test_send_chat_message_success(self, client, mock_chat_engine, sample_chat_response):
+    async def test_send_chat_message_success(self, client, mock_chat_engine, sample_chat_response):
         """Test successful chat message sending."""
         mock_chat_engine.process_message.return_value = sample_chat_response
         
-        request_data = {
-            "message": "Hello, world!",
-            "conversation_id": "conv-123",
-            "include_sources": True
-        }
-        
-        response = client.post("/chat/message", json=request_data)
+        response = await client.post("/chat/message", content=CHAT_MESSAGE_JSON, headers=JSON_HEADERS)
         
         assert response.status_code == 200
         data = response.json()
@@ -109,38 +140,20 @@ class TestChatMessageEndpoint:
         # Verify chat engine was called
         mock_chat_engine.process_message.assert_called_once()
     
-    def test_send_chat_message_validation_error(self, client):
-        """Test chat message validation errors."""
-        # Empty message
-        response = client.post("/chat/message", json={"message": ""})
-        assert response.status_code == 422
-        
-        # Message too long
-        long_message = "x" * 5001
-        response = client.post("/chat/message", json={"message": long_message})
-        assert response.status_code == 422
-    
-    def test_send_chat_message_engine_error(self, client, mock_chat_engine):
+    async def test_send_chat_message_engine_error(self, client, mock_chat_engine):
         """Test chat engine error handling."""
         mock_chat_engine.process_message.side_effect = Exception("Engine error")
         
-        request_data = {"message": "Hello"}
+        response = await client.post("/chat/message", json={"message": "Hello"})
         
-        # The test client will raise the exception since we don't have middleware
-        # In a real app, this would be handled by the exception middleware
-        try:
-            response = client.post("/chat/message", json=request_data)
-            # If we get here, check it's a server error
-            assert response.status_code >= 400
-        except Exception as e:
-            # Expected - the exception propagates without middleware
-            assert "Engine error" in str(e)
+        assert response.status_code == 400
+        assert "Engine error" in response.json()["message"]
 
 
 class TestConversationEndpoints:
     """Test conversation management endpoints."""
     
-    def test_list_conversations(self, client, mock_conversation_manager, sample_conversation):
+    async def test_list_conversations(self, client, mock_conversation_manager, sample_conversation):
         """Test listing conversations."""
         from app.models.chat import ConversationListResponse
         
@@ -149,7 +162,7 @@ class TestConversationEndpoints:
             total=1
         )
         
-        response = client.get("/chat/conversations")
+        response = await client.get("/chat/conversations")
         
         assert response.status_code == 200
         data = response.json()
@@ -157,16 +170,13 @@ class TestConversationEndpoints:
         assert len(data["conversations"]) == 1
         assert data["conversations"][0]["id"] == "conv-123"
     
-    def test_create_conversation(self, client, mock_conversation_manager, sample_conversation):
+    async def test_create_conversation(self, client, mock_conversation_manager, sample_conversation):
         """Test creating a new conversation."""
         mock_conversation_manager.create_conversation.return_value = sample_conversation
         
-        request_data = {
-            "title": "New Conversation",
-            "model_name": "llama2"
-        }
-        
-        response = client.post("/chat/conversations", json=request_data)
+        response = await client.post(
+            "/chat/conversations", content=CREATE_CONVERSATION_JSON, headers=JSON_HEADERS
+        )
         
         assert response.status_code == 200
         data = response.json()
@@ -176,55 +186,52 @@ class TestConversationEndpoints:
         # Verify manager was called
         mock_conversation_manager.create_conversation.assert_called_once()
     
-    def test_get_conversation(self, client, mock_conversation_manager, sample_conversation):
+    async def test_get_conversation(self, client, mock_conversation_manager, sample_conversation):
         """Test getting a specific conversation."""
         mock_conversation_manager.get_conversation.return_value = sample_conversation
         
-        response = client.get("/chat/conversations/conv-123")
+        response = await client.get("/chat/conversations/conv-123")
         
         assert response.status_code == 200
         data = response.json()
         assert data["id"] == "conv-123"
         assert data["title"] == "Test Conversation"
     
-    def test_get_conversation_not_found(self, client, mock_conversation_manager):
+    async def test_get_conversation_not_found(self, client, mock_conversation_manager):
         """Test getting non-existent conversation."""
         mock_conversation_manager.get_conversation.side_effect = ConversationNotFoundError("conv-999")
         
-        response = client.get("/chat/conversations/conv-999")
+        response = await client.get("/chat/conversations/conv-999")
         
         assert response.status_code == 404
         data = response.json()
         assert "not found" in data["detail"]
     
-    def test_delete_conversation(self, client, mock_conversation_manager):
+    async def test_delete_conversation(self, client, mock_conversation_manager):
         """Test deleting a conversation."""
         mock_conversation_manager.delete_conversation.return_value = True
         
-        response = client.delete("/chat/conversations/conv-123")
+        response = await client.delete("/chat/conversations/conv-123")
         
         assert response.status_code == 200
         data = response.json()
         assert "deleted successfully" in data["message"]
         assert data["conversation_id"] == "conv-123"
     
-    def test_delete_conversation_not_found(self, client, mock_conversation_manager):
+    async def test_delete_conversation_not_found(self, client, mock_conversation_manager):
         """Test deleting non-existent conversation."""
         mock_conversation_manager.delete_conversation.return_value = False
         
-        # Similar to engine error test, this will raise an exception without middleware
-        try:
-            response = client.delete("/chat/conversations/conv-999")
-            assert response.status_code == 404
-        except Exception as e:
-            # Expected - the HTTPException propagates without middleware
-            assert "not found" in str(e)
+        response = await client.delete("/chat/conversations/conv-999")
+        
+        assert response.status_code == 404
+        assert "not found" in response.json()["detail"]
 
 
 class TestChatStats:
     """Test chat statistics endpoint."""
     
-    def test_get_chat_stats(self, client, mock_conversation_manager):
+    async def test_get_chat_stats(self, client, mock_conversation_manager):
         """Test getting chat statistics."""
         mock_conversation_manager.get_conversation_stats.return_value = {
             "total_conversations": 10,
@@ -234,7 +241,7 @@ class TestChatStats:
             "model_usage": {"llama2": 5, "mistral": 3}
         }
         
-        response = client.get("/chat/stats")
+        response = await client.get("/chat/stats")
         
         assert response.status_code == 200
         data = response.json()
@@ -243,60 +250,26 @@ class TestChatStats:
         assert "websocket_connections" in data
 
 
-class TestWebSocketManager:
-    """Test WebSocket manager functionality."""
-    
-    def test_websocket_manager_initialization(self):
-        """Test WebSocket manager initialization."""
-        from app.api.endpoints.chat import WebSocketManager
-        
-        manager = WebSocketManager()
-        assert manager.active_connections == {}
-        assert manager.connection_metadata == {}
-    
-    async def test_websocket_connect_disconnect(self):
-        """Test WebSocket connection and disconnection."""
-        from app.api.endpoints.chat import WebSocketManager
-        
-        manager = WebSocketManager()
-        mock_websocket = MagicMock()
-        mock_websocket.accept = AsyncMock()
-        
-        # Test connection
-        await manager.connect(mock_websocket, "conv-123", "client-1")
-        
-        assert "conv-123" in manager.active_connections
-        assert mock_websocket in manager.active_connections["conv-123"]
-        assert mock_websocket in manager.connection_metadata
-        
-        # Test disconnection
-        manager.disconnect(mock_websocket)
-        
-        assert "conv-123" not in manager.active_connections
-        assert mock_websocket not in manager.connection_metadata
-
-
 class TestErrorHandling:
     """Test error handling in chat endpoints."""
     
-    def test_validation_errors(self, client):
-        """Test request validation errors."""
-        # Test invalid chat message requests
-        invalid_requests = [
-            {},  # Missing message
-            {"message": ""},  # Empty message
-            {"message": "x" * 5001},  # Message too long
-        ]
-        
-        for invalid_request in invalid_requests:
-            response = client.post("/chat/message", json=invalid_request)
-            assert response.status_code == 422
+    @pytest.mark.parametrize("payload", [
+        {},
+        {"message": ""},
+        LONG_MESSAGE_PAYLOAD,
+    ], ids=["missing-message", "empty-message", "message-too-long"])
+    def test_validation_errors(self, payload):
+        """Test chat request validation errors."""
+        with pytest.raises(ValidationError):
+            ChatRequest(**payload)
     
-    def test_query_parameter_validation(self, client):
+    async def test_validation_error_response(self, client):
+        """Test validation errors are returned as 422 by the endpoint."""
+        response = await client.post("/chat/message", json={"message": ""})
+        assert response.status_code == 422
+    
+    @pytest.mark.parametrize("limit", [-1, 101])
+    async def test_query_parameter_validation(self, client, limit):
         """Test query parameter validation."""
-        # Test invalid pagination parameters
-        response = client.get("/chat/conversations?limit=-1")
+        response = await client.get(f"/chat/conversations?limit={limit}")
         assert response.status_code == 422
-        
-        response = client.get("/chat/conversations?limit=101")
-        assert response.status_code == 422
\ No newline at end of file
@@ -118,7 +118,6 @@ class TestChatEngine:
         assert chat_engine.default_model == "llama2"
         assert chat_engine.max_context_tokens == 4000
     
-    @pytest.mark.asyncio
     async def test_process_message_new_conversation(
         self, chat_engine, sample_chat_request, sample_search_results,
         mock_conversation_manager, mock_search_engine, mock_ollama_client
@@ -175,7 +174,6 @@ class TestChatEngine:
         chat_engine._retrieve_context.assert_called_once()
         chat_engine._generate_response.assert_called_once()
     
-    @pytest.mark.asyncio
     async def test_process_message_existing_conversation(
         self, chat_engine, sample_chat_request, sample_search_results,
         mock_conversation_manager
@@ -209,7 +207,6 @@ class TestChatEngine:
         mock_conversation_manager.get_conversation.assert_called_with("existing_conv")
         mock_conversation_manager.create_conversation.assert_not_called()
     
-    @pytest.mark.asyncio
     async def test_stream_message(
         self, chat_engine, sample_chat_request, sample_search_results,
         mock_conversation_manager
@@ -257,7 +254,6 @@ class TestChatEngine:
         assert len(final_chunks) == 1
         assert final_chunks[0].sources is not None
     
-    @pytest.mark.asyncio
     async def test_retrieve_context(self, chat_engine, mock_search_engine, sample_search_results):
         """Test context retrieval."""
         # Mock search engine response
@@ -278,7 +274,6 @@ class TestChatEngine:
         # Verify results
         assert results == sample_search_results
     
-    @pytest.mark.asyncio
     async def test_retrieve_context_error_handling(self, chat_engine, mock_search_engine):
         """Test context retrieval error handling."""
         # Mock search engine to raise exception
@@ -288,7 +283,6 @@ class TestChatEngine:
         results = await chat_engine._retrieve_context("test query")
         assert results == []
     
-    @pytest.mark.asyncio
     async def test_generate_response(self, chat_engine, mock_ollama_client, mock_prompt_builder):
         """Test response generation."""
         # Mock Ollama response
@@ -321,7 +315,6 @@ class TestChatEngine:
         mock_prompt_builder.build_rag_prompt.assert_called_once()
         mock_prompt_builder.get_system_prompt.assert_called_once()
     
-    @pytest.mark.asyncio
     async def test_generate_response_with_history(self, chat_engine, mock_ollama_client):
         """Test response generation with conversation history."""
         from app.models.chat import ChatMessage
@@ -353,7 +346,6 @@ class TestChatEngine:
         
         assert response_text == "Response with history."
     
-    @pytest.mark.asyncio
     async def test_generate_response_error_handling(self, chat_engine, mock_ollama_client):
         """Test response generation error handling."""
         from app.services.ollama_client import OllamaModelError
@@ -396,7 +388,6 @@ class TestChatEngine:
         title = chat_engine._generate_conversation_title("")
         assert "Chat" in title
     
-    @pytest.mark.asyncio
     async def test_get_available_models(self, chat_engine, mock_ollama_client):
         """Test getting available models."""
         from app.services.ollama_client import OllamaModelInfo
@@ -418,7 +409,6 @@ class TestChatEngine:
         assert models[0]["name"] == "llama2"
         assert models[1]["name"] == "codellama"
     
-    @pytest.mark.asyncio
     async def test_get_available_models_error(self, chat_engine, mock_ollama_client):
         """Test getting available models with error."""
         # Mock error
@@ -430,7 +420,6 @@ class TestChatEngine:
         models = await chat_engine.get_available_models()
         assert models == []
     
-    @pytest.mark.asyncio
     async def test_validate_model(self, chat_engine, mock_ollama_client):
         """Test model validation."""
         # Mock validation result
@@ -451,7 +440,6 @@ class TestChatEngine:
         assert result["available"] is True
         mock_ollama_client.validate_model.assert_called_once_with("llama2")
     
-    @pytest.mark.asyncio
     async def test_validate_model_error(self, chat_engine, mock_ollama_client):
         """Test model validation with error."""
         # Mock error
@@ -466,7 +454,6 @@ class TestChatEngine:
         assert result["available"] is False
         assert "Validation failed" in result["error"]
     
-    @pytest.mark.asyncio
     async def test_health_check(self, chat_engine, mock_ollama_client, mock_search_engine):
         """Test health check."""
         # Mock healthy services
@@ -484,7 +471,6 @@ class TestChatEngine:
         assert health["conversation_manager"] is True
         assert health["overall"] is True
     
-    @pytest.mark.asyncio
     async def test_health_check_unhealthy(self, chat_engine, mock_ollama_client, mock_search_engine):
         """Test health check with unhealthy services."""
         # Mock unhealthy services
@@ -502,7 +488,6 @@ class TestChatEngine:
         assert health["conversation_manager"] is True  # Always true (file-based)
         assert health["overall"] is False
     
-    @pytest.mark.asyncio
     async def test_process_message_error_handling(
         self, chat_engine, sample_chat_request, mock_conversation_manager
     ):
@@ -531,7 +516,6 @@ class TestChatEngine:
         
         assert "Database error" in str(exc_info.value)
     
-    @pytest.mark.asyncio
     async def test_chat_request_validation(self, chat_engine):
         """Test chat request validation."""
         # Test with invalid request (empty message)
@@ -56,7 +56,6 @@ def integrated_chat_engine(mock_settings):
 class TestChatIntegration:
     """Integration tests for chat functionality."""
     
-    @pytest.mark.asyncio
     async def test_full_chat_workflow(self, integrated_chat_engine):
         """Test complete chat workflow from request to response."""
         # Mock search results
@@ -124,7 +123,6 @@ class TestChatIntegration:
         # Verify sources
         assert response.sources_used[0].chunk.content == mock_chunk.content
     
-    @pytest.mark.asyncio
     async def test_conversation_persistence(self, integrated_chat_engine):
         """Test that conversations persist correctly."""
         # Mock external dependencies
@@ -160,7 +158,6 @@ class TestChatIntegration:
         assert history[0].content == "Hello"
         assert history[2].content == "How are you?"
     
-    @pytest.mark.asyncio
     async def test_streaming_response(self, integrated_chat_engine):
         """Test streaming chat response."""
         # Mock dependencies
@@ -195,7 +192,6 @@ class TestChatIntegration:
         final_chunks = [c for c in chunks if c.is_complete]
         assert len(final_chunks) == 1
     
-    @pytest.mark.asyncio
     async def test_prompt_building_integration(self, integrated_chat_engine):
         """Test that prompt building works correctly with real components."""
         # Create a conversation with history
@@ -231,7 +227,6 @@ class TestChatIntegration:
         assert "Can you elaborate on that?" in prompt
         assert "machine learning" in prompt
     
-    @pytest.mark.asyncio
     async def test_error_handling_integration(self, integrated_chat_engine):
         """Test error handling in integrated system."""
         # Mock search to fail
@@ -254,7 +249,6 @@ class TestChatIntegration:
         assert response.message.content == "I can still respond without search."
         assert response.sources_used == []  # No sources due to search failure
     
-    @pytest.mark.asyncio
     async def test_health_check_integration(self, integrated_chat_engine):
         """Test health check with real components."""
         # Mock healthy services
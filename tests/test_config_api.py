@@ -7,6 +7,7 @@ from fastapi.testclient import TestClient
 from datetime import datetime
 
 from app.main import app
+from app.core.dependencies import get_embedding_service
 from app.models.config import (
     EmbeddingModelInfo,
     ModelStatus,
@@ -28,6 +29,16 @@ def client():
     return TestClient(app)
 
 
+@pytest.fixture
+def override_embedding_service():
+    """Inject a mock embedding service through the app's dependency overrides."""
+    def _override(service):
+        app.dependency_overrides[get_embedding_service] = lambda: service
+    
+    yield _override
+    app.dependency_overrides.pop(get_embedding_service, None)
+
+
 @pytest.fixture
 def mock_embedding_service():
     """Create mock embedding service."""
@@ -188,10 +199,9 @@ class TestEmbeddingModelsEndpoints:
         assert data[1]["key"] == "all-mpnet-base-v2"
         assert data[1]["is_active"] is False
     
-    @patch('app.api.endpoints.config.get_embedding_service')
-    def test_get_active_embedding_model(self, mock_get_service, client, mock_embedding_service):
+    def test_get_active_embedding_model(self, client, override_embedding_service, mock_embedding_service):
         """Test getting active embedding model."""
-        mock_get_service.return_value = mock_embedding_service
+        override_embedding_service(mock_embedding_service)
         
         response = client.get("/api/v1/config/models/embeddings/active")
         
@@ -200,12 +210,11 @@ class TestEmbeddingModelsEndpoints:
         assert data["key"] == "all-minilm-l6-v2"
         assert data["is_active"] is True
     
-    @patch('app.api.endpoints.config.get_embedding_service')
-    def test_get_active_embedding_model_none(self, mock_get_service, client):
+    def test_get_active_embedding_model_none(self, client, override_embedding_service):
         """Test getting active embedding model when none is active."""
         mock_service = AsyncMock()
         mock_service.get_active_model.return_value = None
-        mock_get_service.return_value = mock_service
+        override_embedding_service(mock_service)
         
         response = client.get("/api/v1/config/models/embeddings/active")
         
@@ -574,7 +583,6 @@ class TestErrorHandling:
         assert "Failed to retrieve Ollama models" in response.json()["detail"]
 
 
-@pytest.mark.asyncio
 class TestAsyncBenchmarkTasks:
     """Test async benchmark task functions."""
     
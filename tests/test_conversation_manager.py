@@ -54,7 +54,6 @@ def sample_conversation_request():
 class TestConversationManager:
     """Test ConversationManager class."""
     
-    @pytest.mark.asyncio
     async def test_initialization(self, conversation_manager, temp_dir):
         """Test conversation manager initialization."""
         assert conversation_manager is not None
@@ -64,7 +63,6 @@ class TestConversationManager:
         assert conversations_dir.exists()
         assert conversations_dir.is_dir()
     
-    @pytest.mark.asyncio
     async def test_create_conversation(self, conversation_manager, sample_conversation_request):
         """Test creating a new conversation."""
         conversation = await conversation_manager.create_conversation(sample_conversation_request)
@@ -81,7 +79,6 @@ class TestConversationManager:
         conv_file = conversation_manager.conversations_dir / f"{conversation.id}.json"
         assert conv_file.exists()
     
-    @pytest.mark.asyncio
     async def test_create_conversation_auto_title(self, conversation_manager):
         """Test creating conversation with auto-generated title."""
         request = ConversationCreateRequest()
@@ -91,7 +88,6 @@ class TestConversationManager:
         assert len(conversation.title) > 0
         assert "Conversation" in conversation.title
     
-    @pytest.mark.asyncio
     async def test_get_conversation(self, conversation_manager, sample_conversation_request):
         """Test getting a conversation by ID."""
         # Create conversation
@@ -104,7 +100,6 @@ class TestConversationManager:
         assert retrieved_conv.title == created_conv.title
         assert retrieved_conv.model_name == created_conv.model_name
     
-    @pytest.mark.asyncio
     async def test_get_conversation_not_found(self, conversation_manager):
         """Test getting non-existent conversation."""
         with pytest.raises(ConversationNotFoundError) as exc_info:
@@ -113,7 +108,6 @@ class TestConversationManager:
         assert "not found" in str(exc_info.value)
         assert exc_info.value.status_code == 404
     
-    @pytest.mark.asyncio
     async def test_get_conversation_caching(self, conversation_manager, sample_conversation_request):
         """Test conversation caching."""
         # Create conversation
@@ -127,7 +121,6 @@ class TestConversationManager:
         
         assert conv1 is conv2  # Should be same object from cache
     
-    @pytest.mark.asyncio
     async def test_list_conversations_empty(self, conversation_manager):
         """Test listing conversations when none exist."""
         response = await conversation_manager.list_conversations()
@@ -136,7 +129,6 @@ class TestConversationManager:
         assert len(response.conversations) == 0
         assert response.total == 0
     
-    @pytest.mark.asyncio
     async def test_list_conversations_with_data(self, conversation_manager):
         """Test listing conversations with data."""
         # Create multiple conversations
@@ -162,7 +154,6 @@ class TestConversationManager:
         assert "Conv 1" in titles
         assert "Conv 0" in titles
     
-    @pytest.mark.asyncio
     async def test_list_conversations_with_status_filter(self, conversation_manager):
         """Test listing conversations with status filter."""
         # Create conversations with different statuses
@@ -194,7 +185,6 @@ class TestConversationManager:
         assert len(archived_response.conversations) == 1
         assert archived_response.conversations[0].title == "Archived Conv"
     
-    @pytest.mark.asyncio
     async def test_list_conversations_pagination(self, conversation_manager):
         """Test conversation listing with pagination."""
         # Create multiple conversations
@@ -216,7 +206,6 @@ class TestConversationManager:
         page2_ids = {conv.id for conv in page2.conversations}
         assert page1_ids.isdisjoint(page2_ids)
     
-    @pytest.mark.asyncio
     async def test_add_message(self, conversation_manager, sample_conversation_request):
         """Test adding a message to conversation."""
         # Create conversation
@@ -240,7 +229,6 @@ class TestConversationManager:
         assert updated_conv.message_count == 1
         assert updated_conv.last_message_at is not None
     
-    @pytest.mark.asyncio
     async def test_add_message_with_metadata(self, conversation_manager, sample_conversation_request):
         """Test adding message with additional metadata."""
         conversation = await conversation_manager.create_conversation(sample_conversation_request)
@@ -265,7 +253,6 @@ class TestConversationManager:
         assert message.context_used == "Some context"
         assert message.metadata["confidence"] == 0.95
     
-    @pytest.mark.asyncio
     async def test_get_messages(self, conversation_manager, sample_conversation_request):
         """Test getting messages for a conversation."""
         # Create conversation
@@ -295,7 +282,6 @@ class TestConversationManager:
         assert response.messages[2].content == "How are you?"
         assert response.messages[3].content == "I'm doing well, thanks!"
     
-    @pytest.mark.asyncio
     async def test_get_messages_pagination(self, conversation_manager, sample_conversation_request):
         """Test getting messages with pagination."""
         conversation = await conversation_manager.create_conversation(sample_conversation_request)
@@ -317,7 +303,6 @@ class TestConversationManager:
         assert len(page2.messages) == 2
         assert page2.total_messages == 5
     
-    @pytest.mark.asyncio
     async def test_get_conversation_history(self, conversation_manager, sample_conversation_request):
         """Test getting conversation history for context."""
         conversation = await conversation_manager.create_conversation(sample_conversation_request)
@@ -343,7 +328,6 @@ class TestConversationManager:
         
         assert len(history_limited) <= 5
     
-    @pytest.mark.asyncio
     async def test_update_conversation(self, conversation_manager, sample_conversation_request):
         """Test updating conversation details."""
         conversation = await conversation_manager.create_conversation(sample_conversation_request)
@@ -366,7 +350,6 @@ class TestConversationManager:
         assert updated_conv.metadata["test"] is True  # Original metadata preserved
         assert updated_conv.updated_at > conversation.updated_at
     
-    @pytest.mark.asyncio
     async def test_update_conversation_partial(self, conversation_manager, sample_conversation_request):
         """Test partial conversation update."""
         conversation = await conversation_manager.create_conversation(sample_conversation_request)
@@ -381,7 +364,6 @@ class TestConversationManager:
         assert updated_conv.model_name == conversation.model_name  # Unchanged
         assert updated_conv.system_prompt == conversation.system_prompt  # Unchanged
     
-    @pytest.mark.asyncio
     async def test_delete_conversation(self, conversation_manager, sample_conversation_request):
         """Test deleting a conversation."""
         conversation = await conversation_manager.create_conversation(sample_conversation_request)
@@ -394,13 +376,11 @@ class TestConversationManager:
         deleted_conv = await conversation_manager.get_conversation(conversation.id)
         assert deleted_conv.status == ConversationStatus.DELETED
     
-    @pytest.mark.asyncio
     async def test_delete_nonexistent_conversation(self, conversation_manager):
         """Test deleting non-existent conversation."""
         result = await conversation_manager.delete_conversation("nonexistent-id")
         assert result is False
     
-    @pytest.mark.asyncio
     async def test_cleanup_old_conversations(self, conversation_manager):
         """Test cleaning up old conversations."""
         # Create old conversation
@@ -429,7 +409,6 @@ class TestConversationManager:
         updated_recent = await conversation_manager.get_conversation(recent_conv.id)
         assert updated_recent.status == ConversationStatus.ACTIVE
     
-    @pytest.mark.asyncio
     async def test_get_conversation_stats(self, conversation_manager):
         """Test getting conversation statistics."""
         # Create conversations with different statuses and models
@@ -467,7 +446,6 @@ class TestConversationManager:
         assert stats["model_usage"]["llama2"] == 2
         assert stats["model_usage"]["codellama"] == 1
     
-    @pytest.mark.asyncio
     async def test_message_caching(self, conversation_manager, sample_conversation_request):
         """Test message caching functionality."""
         conversation = await conversation_manager.create_conversation(sample_conversation_request)
@@ -484,7 +462,6 @@ class TestConversationManager:
         assert len(response1.messages) == len(response2.messages)
         assert response1.messages[0].content == response2.messages[0].content
     
-    @pytest.mark.asyncio
     async def test_concurrent_access(self, conversation_manager, sample_conversation_request):
         """Test concurrent access to conversation manager."""
         conversation = await conversation_manager.create_conversation(sample_conversation_request)
@@ -509,7 +486,6 @@ class TestConversationManager:
         response = await conversation_manager.get_messages(conversation.id)
         assert len(response.messages) == 15
     
-    @pytest.mark.asyncio
     async def test_file_persistence(self, conversation_manager, sample_conversation_request, temp_dir):
         """Test that data persists to files correctly."""
         conversation = await conversation_manager.create_conversation(sample_conversation_request)
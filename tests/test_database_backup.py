@@ -581,7 +581,6 @@ class TestHelperFunctions:
         checksum3 = _calculate_export_checksum(different_data)
         assert checksum1 != checksum3
     
-    @pytest.mark.asyncio
     async def test_validate_export_data_valid(self):
         """Test export data validation with valid data."""
         from app.api.endpoints.database import _validate_export_data
@@ -605,7 +604,6 @@ class TestHelperFunctions:
         assert result["valid"] is True
         assert len(result["errors"]) == 0
     
-    @pytest.mark.asyncio
     async def test_validate_export_data_invalid(self):
         """Test export data validation with invalid data."""
         from app.api.endpoints.database import _validate_export_data
@@ -630,7 +628,6 @@ class TestHelperFunctions:
         assert len(result["errors"]) > 0
         assert len(result["warnings"]) > 0
     
-    @pytest.mark.asyncio
     async def test_parse_import_file_json(self):
         """Test parsing JSON import file."""
         from app.api.endpoints.database import _parse_import_file
@@ -642,7 +639,6 @@ class TestHelperFunctions:
         result = await _parse_import_file(encoded_data)
         assert result == test_data
     
-    @pytest.mark.asyncio
     async def test_parse_import_file_gzipped(self):
         """Test parsing gzipped import file."""
         from app.api.endpoints.database import _parse_import_file
@@ -655,7 +651,6 @@ class TestHelperFunctions:
         result = await _parse_import_file(encoded_data)
         assert result == test_data
     
-    @pytest.mark.asyncio
     async def test_parse_import_file_invalid(self):
         """Test parsing invalid import file."""
         from app.api.endpoints.database import _parse_import_file
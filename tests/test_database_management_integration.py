@@ -114,7 +114,6 @@ class TestDatabaseManagementIntegration:
             }
         }
     
-    @pytest.mark.asyncio
     async def test_export_import_roundtrip(self, client, vector_db, sample_documents):
         """Test complete export-import roundtrip."""
         # First, export the database
@@ -165,7 +164,6 @@ class TestDatabaseManagementIntegration:
             # Import might still be processing, that's okay for this test
             assert status["status"] in ["processing", "completed", "starting"]
     
-    @pytest.mark.asyncio
     async def test_database_health_monitoring(self, client, vector_db, sample_documents):
         """Test database health monitoring functionality."""
         health_response = client.get("/api/v1/database/health")
@@ -193,7 +191,6 @@ class TestDatabaseManagementIntegration:
         assert "chunks_per_document" in metrics
         assert "avg_document_size_mb" in metrics
     
-    @pytest.mark.asyncio
     async def test_database_integrity_validation(self, client, vector_db, sample_documents):
         """Test database integrity validation."""
         validation_response = client.post("/api/v1/database/validate")
@@ -216,7 +213,6 @@ class TestDatabaseManagementIntegration:
         assert "orphaned_chunks" in stats
         assert "chunks_without_embeddings" in stats
     
-    @pytest.mark.asyncio
     async def test_export_with_different_formats(self, client, vector_db, sample_documents):
         """Test export with different formats and options."""
         # Test JSON export
@@ -234,7 +230,6 @@ class TestDatabaseManagementIntegration:
         assert csv_response.status_code == 200
         assert csv_response.headers["content-type"] == "application/zip"
     
-    @pytest.mark.asyncio
     async def test_import_validation_only(self, client, vector_db, sample_documents):
         """Test import validation-only mode."""
         # First export data
@@ -264,7 +259,6 @@ class TestDatabaseManagementIntegration:
         assert "conflicts" in preview
         assert "estimated_time_minutes" in preview
     
-    @pytest.mark.asyncio
     async def test_import_conflict_detection(self, client, vector_db, sample_documents):
         """Test import conflict detection."""
         # Export current data
@@ -286,7 +280,6 @@ class TestDatabaseManagementIntegration:
         conflict_result = conflict_response.json()
         assert "conflicts" in conflict_result["detail"]
     
-    @pytest.mark.asyncio
     async def test_database_statistics_accuracy(self, client, vector_db, sample_documents):
         """Test accuracy of database statistics."""
         stats_response = client.get("/api/v1/database/stats")
@@ -310,7 +303,6 @@ class TestDatabaseManagementIntegration:
         assert stats["by_status"].get("completed", 0) >= 2
         assert stats["by_language"].get("en", 0) >= 3
     
-    @pytest.mark.asyncio
     async def test_document_listing_and_management(self, client, vector_db, sample_documents):
         """Test document listing and management operations."""
         # Test document listing
@@ -341,7 +333,6 @@ class TestDatabaseManagementIntegration:
         # Should find documents with "test" in filename
         assert search_result["total"] >= 1
     
-    @pytest.mark.asyncio
     async def test_document_deletion_cascade(self, client, vector_db, sample_documents):
         """Test document deletion with cascade to chunks."""
         # Get initial stats
@@ -362,7 +353,6 @@ class TestDatabaseManagementIntegration:
         assert updated_stats["total_documents"] == initial_stats["total_documents"] - 1
         assert updated_stats["total_chunks"] == initial_chunks - 2
     
-    @pytest.mark.asyncio
     async def test_error_handling_and_recovery(self, client, vector_db):
         """Test error handling and recovery scenarios."""
         # Test export with empty database
@@ -401,7 +391,6 @@ class TestDatabaseBackupRestore:
         """Create test client."""
         return TestClient(app)
     
-    @pytest.mark.asyncio
     async def test_full_backup_restore_workflow(self, client):
         """Test complete backup and restore workflow."""
         # This test would require a more complex setup with actual documents
@@ -441,7 +430,6 @@ class TestDatabaseBackupRestore:
         assert "validation_result" in import_result
         assert import_result["validation_result"]["valid"] is True
     
-    @pytest.mark.asyncio
     async def test_backup_integrity_verification(self, client):
         """Test backup integrity verification."""
         # Export database
@@ -461,7 +449,6 @@ class TestDatabaseBackupRestore:
         assert len(checksum) == 64
         assert all(c in '0123456789abcdef' for c in checksum.lower())
     
-    @pytest.mark.asyncio
     async def test_incremental_backup_simulation(self, client):
         """Test simulation of incremental backup workflow."""
         # This would test incremental backup functionality
@@ -67,7 +67,6 @@ def sample_metadata():
 class TestDatabaseMigrationService:
     """Test cases for DatabaseMigrationService."""
     
-    @pytest.mark.asyncio
     async def test_validate_schema_success(self, migration_service, mock_vector_db, sample_metadata):
         """Test successful schema validation."""
         # Mock vector database responses
@@ -88,7 +87,6 @@ class TestDatabaseMigrationService:
         assert len(result["errors"]) == 0
         assert "validation_timestamp" in result
     
-    @pytest.mark.asyncio
     async def test_validate_schema_collection_not_exists(self, migration_service, mock_vector_db):
         """Test schema validation when collection doesn't exist."""
         mock_vector_db.validate_schema.return_value = {
@@ -101,7 +99,6 @@ class TestDatabaseMigrationService:
         assert result["schema_version"] is None
         assert "Collection does not exist" in result["errors"]
     
-    @pytest.mark.asyncio
     async def test_validate_schema_no_data(self, migration_service, mock_vector_db):
         """Test schema validation with no data."""
         mock_vector_db.validate_schema.return_value = {
@@ -118,7 +115,6 @@ class TestDatabaseMigrationService:
         assert result["is_valid"] is True
         assert "No data available for schema validation" in result["warnings"]
     
-    @pytest.mark.asyncio
     async def test_validate_schema_missing_required_fields(self, migration_service, mock_vector_db):
         """Test schema validation with missing required fields."""
         incomplete_metadata = [
@@ -144,7 +140,6 @@ class TestDatabaseMigrationService:
         assert len(result["errors"]) > 0
         assert any("missing from all records" in error for error in result["errors"])
     
-    @pytest.mark.asyncio
     async def test_validate_schema_type_errors(self, migration_service, mock_vector_db):
         """Test schema validation with type errors."""
         invalid_metadata = [
@@ -174,7 +169,6 @@ class TestDatabaseMigrationService:
         assert result["field_analysis"]["chunk_index"]["type_errors"] > 0
         assert any("type errors" in warning for warning in result["warnings"])
     
-    @pytest.mark.asyncio
     async def test_migrate_schema_same_version(self, migration_service, mock_vector_db, sample_metadata):
         """Test migration when already at target version."""
         mock_vector_db.validate_schema.return_value = {
@@ -193,7 +187,6 @@ class TestDatabaseMigrationService:
         assert result["to_version"] == SchemaVersion.V1_0_0
         assert "already at target version" in result["warnings"][0]
     
-    @pytest.mark.asyncio
     async def test_migrate_schema_dry_run(self, migration_service, mock_vector_db):
         """Test migration in dry run mode."""
         mock_vector_db.validate_schema.return_value = {
@@ -211,7 +204,6 @@ class TestDatabaseMigrationService:
         assert result["status"] == MigrationStatus.COMPLETED
         assert "Dry run - no changes were made" in result["warnings"]
     
-    @pytest.mark.asyncio
     async def test_migrate_schema_new_installation(self, migration_service, mock_vector_db):
         """Test migration for new installation (no existing schema)."""
         mock_vector_db.validate_schema.return_value = {
@@ -231,7 +223,6 @@ class TestDatabaseMigrationService:
         assert result["to_version"] == SchemaVersion.V1_0_0
         assert any(step["step"] == "initialize_schema" for step in result["steps"])
     
-    @pytest.mark.asyncio
     async def test_backup_collection_success(self, migration_service, mock_vector_db):
         """Test successful collection backup."""
         sample_data = {
@@ -251,7 +242,6 @@ class TestDatabaseMigrationService:
         assert backup_info["schema_version"] == SchemaVersion.V1_0_0
         assert backup_info["data"] == sample_data
     
-    @pytest.mark.asyncio
     async def test_backup_collection_auto_name(self, migration_service, mock_vector_db):
         """Test backup with auto-generated name."""
         mock_vector_db._collection.get.return_value = {"ids": []}
@@ -262,7 +252,6 @@ class TestDatabaseMigrationService:
         assert backup_info["backup_name"].startswith("backup_")
         assert "created_at" in backup_info
     
-    @pytest.mark.asyncio
     async def test_restore_collection_success(self, migration_service, mock_vector_db):
         """Test successful collection restoration."""
         backup_data = {
@@ -290,7 +279,6 @@ class TestDatabaseMigrationService:
         mock_vector_db.reset_collection.assert_called_once()
         mock_vector_db._collection.add.assert_called_once()
     
-    @pytest.mark.asyncio
     async def test_restore_collection_invalid_backup(self, migration_service, mock_vector_db):
         """Test restoration with invalid backup data."""
         invalid_backup = {
@@ -394,7 +382,6 @@ class TestDatabaseMigrationService:
         
         assert is_valid is False
     
-    @pytest.mark.asyncio
     async def test_plan_migration_new_installation(self, migration_service):
         """Test migration planning for new installation."""
         steps = await migration_service._plan_migration(None, SchemaVersion.V1_0_0)
@@ -403,7 +390,6 @@ class TestDatabaseMigrationService:
         assert steps[0]["step"] == "initialize_schema"
         assert steps[0]["type"] == "schema_creation"
     
-    @pytest.mark.asyncio
     async def test_plan_migration_version_upgrade(self, migration_service):
         """Test migration planning for version upgrade."""
         # This would be used when we have multiple schema versions
@@ -412,7 +398,6 @@ class TestDatabaseMigrationService:
         # For same version, no steps needed (handled in migrate_schema)
         assert isinstance(steps, list)
     
-    @pytest.mark.asyncio
     async def test_execute_migration_backup_step(self, migration_service, mock_vector_db):
         """Test execution of backup migration step."""
         migration_steps = [
@@ -435,7 +420,6 @@ class TestDatabaseMigrationService:
         assert migration_steps[0]["status"] == "completed"
         assert "backup_info" in migration_steps[0]
     
-    @pytest.mark.asyncio
     async def test_execute_migration_validation_failure(self, migration_service, mock_vector_db):
         """Test migration execution with validation failure."""
         migration_steps = [
@@ -144,7 +144,6 @@ This document should be split into multiple chunks based on the configured chunk
         with pytest.raises(ValidationError, match="Unsupported file type"):
             processor._detect_file_type("/path/file.xyz", "file.xyz")
     
-    @pytest.mark.asyncio
     async def test_validate_file_success(self, processor, sample_text_file):
         """Test successful file validation."""
         file_info = await processor._validate_file(sample_text_file, "test_document.txt")
@@ -154,19 +153,16 @@ This document should be split into multiple chunks based on the configured chunk
         assert file_info['is_audio'] is False
         assert 'mime_type' in file_info
     
-    @pytest.mark.asyncio
     async def test_validate_file_not_found(self, processor):
         """Test validation of non-existent file."""
         with pytest.raises(ValidationError, match="File not found"):
             await processor._validate_file("/nonexistent/file.txt", "file.txt")
     
-    @pytest.mark.asyncio
     async def test_validate_file_empty(self, processor, empty_file):
         """Test validation of empty file."""
         with pytest.raises(ValidationError, match="File is empty"):
             await processor._validate_file(empty_file, "empty_file.txt")
     
-    @pytest.mark.asyncio
     async def test_validate_file_too_large(self, processor, large_file):
         """Test validation of file that's too large."""
         with pytest.raises(ValidationError, match="File too large"):
@@ -174,7 +170,6 @@ This document should be split into multiple chunks based on the configured chunk
 
     # Content Extraction Tests
     
-    @pytest.mark.asyncio
     async def test_extract_text_content(self, processor, sample_text_file):
         """Test text content extraction."""
         file_info = {'type': DocumentType.TXT, 'is_audio': False}
@@ -187,7 +182,6 @@ This document should be split into multiple chunks based on the configured chunk
         assert result['language'] in ['en', 'fr', 'es', 'unknown']
         assert result['docling_doc'] is None
     
-    @pytest.mark.asyncio
     @patch('app.services.document_processor.DocumentConverter')
     async def test_extract_docling_content(self, mock_converter_class, processor, sample_html_file):
         """Test Docling content extraction."""
@@ -211,7 +205,6 @@ This document should be split into multiple chunks based on the configured chunk
         assert result['docling_doc'] == mock_doc
         assert 'word_count' in result
     
-    @pytest.mark.asyncio
     @patch('app.services.document_processor.DocumentConverter')
     async def test_extract_audio_content(self, mock_converter_class, processor, temp_dir):
         """Test audio content extraction."""
@@ -241,7 +234,6 @@ This document should be split into multiple chunks based on the configured chunk
 
     # Chunking Tests
     
-    @pytest.mark.asyncio
     async def test_create_simple_chunks(self, processor):
         """Test simple chunking strategy."""
         content = """# Test Document
@@ -289,7 +281,6 @@ This is content in section 2 with different text to ensure proper chunk boundari
         finally:
             processor.settings.CHUNK_SIZE = original_chunk_size
     
-    @pytest.mark.asyncio
     async def test_create_hybrid_chunks(self, processor):
         """Test hybrid chunking strategy with Docling."""
         content = "Test content for hybrid chunking"
@@ -366,7 +357,6 @@ This is content in section 2 with different text to ensure proper chunk boundari
 
     # Integration Tests
     
-    @pytest.mark.asyncio
     @patch('app.services.document_processor.DocumentConverter')
     async def test_process_document_success(self, mock_converter_class, processor, sample_text_file):
         """Test complete document processing pipeline."""
@@ -390,7 +380,6 @@ This is content in section 2 with different text to ensure proper chunk boundari
         assert "test" in result.metadata
         assert "processing_time_seconds" in result.metadata
     
-    @pytest.mark.asyncio
     async def test_process_document_validation_error(self, processor):
         """Test document processing with validation error."""
         with pytest.raises(ValidationError):
@@ -399,7 +388,6 @@ This is content in section 2 with different text to ensure proper chunk boundari
                 filename="nonexistent.txt"
             )
     
-    @pytest.mark.asyncio
     @patch('app.services.document_processor.DocumentConverter')
     async def test_process_document_extraction_error(self, mock_converter_class, processor, sample_text_file):
         """Test document processing with extraction error."""
@@ -439,7 +427,6 @@ This is content in section 2 with different text to ensure proper chunk boundari
         assert len(hash1) == 64  # SHA-256 hash length
         assert all(c in '0123456789abcdef' for c in hash1)  # Valid hex
     
-    @pytest.mark.asyncio
     async def test_cleanup_temp_files(self, processor, temp_dir):
         """Test temporary file cleanup."""
         # Create temporary file
@@ -455,7 +442,6 @@ This is content in section 2 with different text to ensure proper chunk boundari
 
     # Error Handling Tests
     
-    @pytest.mark.asyncio
     async def test_extract_content_with_docling_error(self, processor, sample_html_file):
         """Test content extraction when Docling fails."""
         # Mock Docling to raise exception by setting the private attribute
@@ -484,7 +470,6 @@ This is content in section 2 with different text to ensure proper chunk boundari
         assert isinstance(metadata, dict)
         # Should have some basic structure even with errors
     
-    @pytest.mark.asyncio
     async def test_create_chunks_empty_content(self, processor):
         """Test chunk creation with empty content."""
         document = Document(
@@ -502,7 +487,6 @@ This is content in section 2 with different text to ensure proper chunk boundari
 
     # Performance Tests
     
-    @pytest.mark.asyncio
     async def test_large_document_chunking(self, processor):
         """Test chunking of large documents."""
         # Create large content with paragraph breaks to force chunking
@@ -530,7 +514,6 @@ This is content in section 2 with different text to ensure proper chunk boundari
             assert len(chunk.content) <= processor.settings.CHUNK_SIZE * 1.5  # Allow some flexibility
             assert chunk.token_count > 0
     
-    @pytest.mark.asyncio
     async def test_concurrent_processing(self, processor, sample_text_file):
         """Test concurrent document processing."""
         import asyncio
@@ -583,7 +566,6 @@ class TestDocumentProcessorIntegration:
     """Integration tests for DocumentProcessor with real files."""
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_real_text_file_processing(self, processor_with_mock_settings, tmp_path):
         """Test processing a real text file."""
         # Create a real markdown file
@@ -48,7 +48,6 @@ class TestDocumentWebSocketIntegration:
             }
         ]
     
-    @pytest.mark.asyncio
     async def test_websocket_connection_establishment(self):
         """Test WebSocket connection establishment"""
         # Mock WebSocket connection
@@ -59,7 +58,6 @@ class TestDocumentWebSocketIntegration:
         connection_established = mock_websocket.open
         assert connection_established is True
     
-    @pytest.mark.asyncio
     async def test_websocket_message_handling(self):
         """Test WebSocket message handling"""
         received_messages = []
@@ -81,7 +79,6 @@ class TestDocumentWebSocketIntegration:
         assert received_messages[0]['status'] == 'pending'
         assert received_messages[-1]['status'] == 'completed'
     
-    @pytest.mark.asyncio
     async def test_websocket_connection_recovery(self):
         """Test WebSocket connection recovery after disconnection"""
         connection_attempts = []
@@ -103,7 +100,6 @@ class TestDocumentWebSocketIntegration:
         assert len(connection_attempts) == 3
         assert connection_attempts[-1]['attempt'] == 3
     
-    @pytest.mark.asyncio
     async def test_websocket_error_handling(self):
         """Test WebSocket error handling"""
         error_scenarios = [
@@ -129,7 +125,6 @@ class TestDocumentWebSocketIntegration:
         assert len(handled_errors) == 4
         assert all(error['handled'] for error in handled_errors)
     
-    @pytest.mark.asyncio
     async def test_websocket_message_validation(self):
         """Test WebSocket message validation"""
         valid_message = {
@@ -175,7 +170,6 @@ class TestDocumentWebSocketIntegration:
             is_valid, error = validate_message(invalid_msg)
             assert is_valid is False
     
-    @pytest.mark.asyncio
     async def test_websocket_progress_tracking(self):
         """Test progress tracking through WebSocket messages"""
         progress_history = []
@@ -200,7 +194,6 @@ class TestDocumentWebSocketIntegration:
         for i in range(1, len(progress_history)):
             assert progress_history[i]['progress'] >= progress_history[i-1]['progress']
     
-    @pytest.mark.asyncio
     async def test_websocket_multiple_documents(self):
         """Test handling multiple document processing simultaneously"""
         multi_doc_messages = [
@@ -230,7 +223,6 @@ class TestDocumentWebSocketIntegration:
         assert document_states['doc_2']['status'] == 'processing'
         assert document_states['doc_3']['status'] == 'processing'
     
-    @pytest.mark.asyncio
     async def test_websocket_heartbeat_mechanism(self):
         """Test WebSocket heartbeat/ping-pong mechanism"""
         heartbeat_messages = []
@@ -260,7 +252,6 @@ class TestDocumentWebSocketIntegration:
         assert ping_count == 3
         assert pong_count == 3
     
-    @pytest.mark.asyncio
     async def test_websocket_authentication(self):
         """Test WebSocket authentication and authorization"""
         auth_scenarios = [
@@ -279,7 +270,6 @@ class TestDocumentWebSocketIntegration:
             is_authenticated = mock_authenticate(scenario['token'])
             assert is_authenticated == scenario['expected']
     
-    @pytest.mark.asyncio
     async def test_websocket_rate_limiting(self):
         """Test WebSocket rate limiting"""
         message_timestamps = []
@@ -307,7 +297,6 @@ class TestDocumentWebSocketIntegration:
         
         assert len(rate_limit_violations) > 0
     
-    @pytest.mark.asyncio
     async def test_websocket_message_ordering(self):
         """Test WebSocket message ordering and sequence handling"""
         messages_with_sequence = [
@@ -349,7 +338,6 @@ class TestDocumentWebSocketIntegration:
 class TestDocumentWebSocketPerformance:
     """Test WebSocket performance and scalability"""
     
-    @pytest.mark.asyncio
     async def test_websocket_concurrent_connections(self):
         """Test handling multiple concurrent WebSocket connections"""
         concurrent_connections = 50
@@ -367,7 +355,6 @@ class TestDocumentWebSocketPerformance:
         assert len(results) == concurrent_connections
         assert all(result['status'] == 'connected' for result in results)
     
-    @pytest.mark.asyncio
     async def test_websocket_message_throughput(self):
         """Test WebSocket message throughput"""
         message_count = 1000
@@ -392,7 +379,6 @@ class TestDocumentWebSocketPerformance:
         assert len(processed_messages) == message_count
         assert processing_time < 5.0  # Should process 1000 messages in under 5 seconds
     
-    @pytest.mark.asyncio
     async def test_websocket_memory_usage(self):
         """Test WebSocket memory usage with large message volumes"""
         large_message_count = 10000
@@ -149,7 +149,6 @@ class TestEmbeddingService:
         assert len(embedding_service._model_info) == len(EmbeddingService.DEFAULT_MODELS)
         assert embedding_service._active_model_key is None
     
-    @pytest.mark.asyncio
     async def test_get_available_models(self, embedding_service):
         """Test getting available models."""
         models = await embedding_service.get_available_models()
@@ -158,19 +157,16 @@ class TestEmbeddingService:
         assert all(isinstance(model, EmbeddingModelInfo) for model in models)
         assert all(model.status == ModelStatus.AVAILABLE for model in models)
     
-    @pytest.mark.asyncio
     async def test_get_active_model_none(self, embedding_service):
         """Test getting active model when none is set."""
         active_model = await embedding_service.get_active_model()
         assert active_model is None
     
-    @pytest.mark.asyncio
     async def test_load_model_not_found(self, embedding_service):
         """Test loading a non-existent model."""
         with pytest.raises(ModelNotFoundError):
             await embedding_service.load_model("non-existent-model")
     
-    @pytest.mark.asyncio
     @patch('app.services.embedding_service.SentenceTransformer')
     async def test_load_model_success(self, mock_st_class, embedding_service, mock_sentence_transformer):
         """Test successful model loading."""
@@ -184,7 +180,6 @@ class TestEmbeddingService:
         assert model_info.load_time is not None
         assert "all-minilm-l6-v2" in embedding_service._models
     
-    @pytest.mark.asyncio
     @patch('app.services.embedding_service.SentenceTransformer')
     async def test_load_model_failure(self, mock_st_class, embedding_service):
         """Test model loading failure."""
@@ -197,7 +192,6 @@ class TestEmbeddingService:
         model_info = embedding_service._model_info["all-minilm-l6-v2"]
         assert model_info.status == ModelStatus.ERROR
     
-    @pytest.mark.asyncio
     @patch('app.services.embedding_service.SentenceTransformer')
     async def test_switch_model(self, mock_st_class, embedding_service, mock_sentence_transformer):
         """Test model switching."""
@@ -214,7 +208,6 @@ class TestEmbeddingService:
             if key != "all-minilm-l6-v2":
                 assert info.is_active is False
     
-    @pytest.mark.asyncio
     @patch('app.services.embedding_service.SentenceTransformer')
     async def test_generate_embedding(self, mock_st_class, embedding_service, mock_sentence_transformer):
         """Test single embedding generation."""
@@ -233,7 +226,6 @@ class TestEmbeddingService:
         # Model should be called twice: once for dimensions during load, once for actual embedding
         assert mock_sentence_transformer.encode.call_count == 2
     
-    @pytest.mark.asyncio
     @patch('app.services.embedding_service.SentenceTransformer')
     async def test_generate_embedding_with_cache(self, mock_st_class, embedding_service, mock_sentence_transformer):
         """Test embedding generation with caching."""
@@ -256,7 +248,6 @@ class TestEmbeddingService:
         # Second call should use cache
         assert mock_sentence_transformer.encode.call_count == 2
     
-    @pytest.mark.asyncio
     @patch('app.services.embedding_service.SentenceTransformer')
     async def test_generate_embedding_auto_load_default(self, mock_st_class, embedding_service, mock_sentence_transformer):
         """Test embedding generation with automatic default model loading."""
@@ -269,7 +260,6 @@ class TestEmbeddingService:
         assert embedding_service._active_model_key == "all-minilm-l6-v2"
         assert embedding == [0.1, 0.2, 0.3, 0.4]
     
-    @pytest.mark.asyncio
     @patch('app.services.embedding_service.SentenceTransformer')
     async def test_generate_embeddings_batch(self, mock_st_class, embedding_service, mock_sentence_transformer):
         """Test batch embedding generation."""
@@ -300,7 +290,6 @@ class TestEmbeddingService:
         assert response.processing_time > 0
         assert response.cached_count == 0  # First time, nothing cached
     
-    @pytest.mark.asyncio
     @patch('app.services.embedding_service.SentenceTransformer')
     async def test_generate_embeddings_batch_with_cache(self, mock_st_class, embedding_service, mock_sentence_transformer):
         """Test batch embedding generation with partial caching."""
@@ -329,7 +318,6 @@ class TestEmbeddingService:
         assert response.embeddings[0] == [0.1, 0.2, 0.3, 0.4]  # From cache
         assert response.embeddings[1] == [0.5, 0.6, 0.7, 0.8]  # Newly generated
     
-    @pytest.mark.asyncio
     @patch('app.services.embedding_service.SentenceTransformer')
     async def test_benchmark_models(self, mock_st_class, embedding_service, mock_sentence_transformer):
         """Test model benchmarking."""
@@ -359,7 +347,6 @@ class TestEmbeddingService:
         assert model_info.performance_score is not None
         assert model_info.benchmark_date is not None
     
-    @pytest.mark.asyncio
     async def test_get_service_stats(self, embedding_service):
         """Test getting service statistics."""
         stats = await embedding_service.get_service_stats()
@@ -374,7 +361,6 @@ class TestEmbeddingService:
         assert stats["loaded_models"] == []
         assert stats["available_models"] == len(EmbeddingService.DEFAULT_MODELS)
     
-    @pytest.mark.asyncio
     async def test_cleanup(self, embedding_service):
         """Test service cleanup."""
         # Add some data to cache
@@ -390,7 +376,6 @@ class TestEmbeddingService:
 class TestEmbeddingServiceIntegration:
     """Integration tests for EmbeddingService."""
     
-    @pytest.mark.asyncio
     @patch('app.services.embedding_service.SentenceTransformer')
     async def test_full_workflow(self, mock_st_class):
         """Test complete workflow from initialization to embedding generation."""
@@ -436,7 +421,6 @@ class TestFactoryFunctions:
         
         assert service1 is service2
     
-    @pytest.mark.asyncio
     @patch('app.services.embedding_service.SentenceTransformer')
     async def test_initialize_embedding_service(self, mock_st_class):
         """Test embedding service initialization with default model."""
@@ -454,7 +438,6 @@ class TestFactoryFunctions:
 class TestErrorHandling:
     """Test error handling in EmbeddingService."""
     
-    @pytest.mark.asyncio
     async def test_generate_embedding_model_not_loaded(self):
         """Test error when trying to generate embedding with unloaded model."""
         service = EmbeddingService()
@@ -462,7 +445,6 @@ class TestErrorHandling:
         with pytest.raises(ModelNotFoundError):
             await service.generate_embedding("test", model_key="non-existent")
     
-    @pytest.mark.asyncio
     @patch('app.services.embedding_service.SentenceTransformer')
     async def test_generate_embedding_model_error(self, mock_st_class):
         """Test error handling during embedding generation."""
@@ -480,7 +462,6 @@ class TestErrorHandling:
         with pytest.raises(EmbeddingServiceError):
             await service.generate_embedding("test", model_key="all-minilm-l6-v2")
     
-    @pytest.mark.asyncio
     @patch('app.services.embedding_service.SentenceTransformer')
     async def test_benchmark_model_error(self, mock_st_class):
         """Test error handling during model benchmarking."""
@@ -1,5 +1,7 @@
 """Tests for health service."""
 
+import asyncio
+import threading
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 import time
@@ -15,7 +17,6 @@ class TestHealthService:
         """Create health service instance."""
         return HealthService()
     
-    @pytest.mark.asyncio
     async def test_get_health_status_caching(self, health_service):
         """Test that health status is cached."""
         # Mock all health check methods
@@ -45,7 +46,6 @@ class TestHealthService:
             mock_embedding.assert_called_once()
             mock_system.assert_called_once()
     
-    @pytest.mark.asyncio
     async def test_get_health_status_force_refresh(self, health_service):
         """Test force refresh bypasses cache."""
         with patch.object(health_service, '_check_chroma_health', new_callable=AsyncMock) as mock_chroma, \
@@ -71,7 +71,6 @@ class TestHealthService:
             assert mock_embedding.call_count == 2
             assert mock_system.call_count == 2
     
-    @pytest.mark.asyncio
     async def test_overall_status_calculation(self, health_service):
         """Test overall status calculation logic."""
         with patch.object(health_service, '_check_chroma_health', new_callable=AsyncMock) as mock_chroma, \
@@ -101,7 +100,43 @@ class TestHealthService:
             status = await health_service.get_health_status(force_refresh=True)
             assert status["status"] == HealthStatus.UNHEALTHY
     
-    @pytest.mark.asyncio
+    async def test_slow_probe_reported_unhealthy(self, health_service):
+        """Test that a probe exceeding the timeout is reported unhealthy."""
+        async def hanging_check():
+            await asyncio.sleep(1)
+        
+        health_service._probe_timeout = 0.05
+        
+        with patch.object(health_service, '_check_chroma_health', side_effect=hanging_check), \
+             patch.object(health_service, '_check_ollama_health', new_callable=AsyncMock) as mock_ollama, \
+             patch.object(health_service, '_check_embedding_service_health', new_callable=AsyncMock) as mock_embedding, \
+             patch.object(health_service, '_check_system_resources', new_callable=AsyncMock) as mock_system:
+            
+            mock_ollama.return_value = {"status": HealthStatus.HEALTHY}
+            mock_embedding.return_value = {"status": HealthStatus.HEALTHY}
+            mock_system.return_value = {"status": HealthStatus.HEALTHY}
+            
+            status = await health_service.get_health_status(force_refresh=True)
+            
+            assert status["status"] == HealthStatus.DEGRADED
+            assert status["services"]["chroma"]["status"] == HealthStatus.UNHEALTHY
+            assert "timed out" in status["services"]["chroma"]["error"]
+    
+    async def test_system_resources_sampled_off_event_loop(self, health_service):
+        """Test that blocking psutil sampling runs on the probe pool."""
+        pytest.importorskip("psutil")
+        sampled_in = []
+        
+        def fake_sample(psutil):
+            sampled_in.append(threading.current_thread().name)
+            return 10.0, MagicMock(percent=10.0, available=0), MagicMock(percent=10.0, free=0)
+        
+        with patch.object(health_service, '_sample_system_resources', side_effect=fake_sample):
+            result = await health_service._check_system_resources()
+        
+        assert result["status"] == HealthStatus.HEALTHY
+        assert sampled_in[0].startswith("health-probe")
+    
     async def test_check_chroma_health_success(self, health_service):
         """Test successful ChromaDB health check."""
         mock_vector_db = AsyncMock()
@@ -116,7 +151,6 @@ class TestHealthService:
             assert result["collections_count"] == 2
             assert "url" in result
     
-    @pytest.mark.asyncio
     async def test_check_chroma_health_failure(self, health_service):
         """Test ChromaDB health check failure."""
         mock_vector_db = AsyncMock()
@@ -129,7 +163,6 @@ class TestHealthService:
             assert "error" in result
             assert "Connection failed" in result["error"]
     
-    @pytest.mark.asyncio
     async def test_check_ollama_health_success(self, health_service):
         """Test successful Ollama health check."""
         mock_ollama = AsyncMock()
@@ -152,7 +185,6 @@ class TestHealthService:
             assert result["configured_model"] == "llama2"
             assert len(result["available_models"]) == 2
     
-    @pytest.mark.asyncio
     async def test_check_ollama_health_model_not_available(self, health_service):
         """Test Ollama health check when configured model is not available."""
         mock_ollama = AsyncMock()
@@ -173,7 +205,6 @@ class TestHealthService:
             assert result["model_available"] is False
             assert result["configured_model"] == "llama2"
     
-    @pytest.mark.asyncio
     async def test_check_ollama_health_service_unavailable(self, health_service):
         """Test Ollama health check when service is unavailable."""
         mock_ollama = AsyncMock()
@@ -189,7 +220,6 @@ class TestHealthService:
             assert result["status"] == HealthStatus.UNHEALTHY
             assert "error" in result
     
-    @pytest.mark.asyncio
     async def test_check_embedding_service_health_success(self, health_service):
         """Test successful embedding service health check."""
         mock_embedding_service = AsyncMock()
@@ -207,7 +237,6 @@ class TestHealthService:
             assert len(result["available_models"]) == 2
             assert result["device"] == "cpu"
     
-    @pytest.mark.asyncio
     async def test_check_embedding_service_health_failure(self, health_service):
         """Test embedding service health check failure."""
         mock_embedding_service = AsyncMock()
@@ -219,7 +248,6 @@ class TestHealthService:
             assert result["status"] == HealthStatus.UNHEALTHY
             assert "error" in result
     
-    @pytest.mark.asyncio
     async def test_check_system_resources_success(self, health_service):
         """Test successful system resources check."""
         mock_memory = MagicMock()
@@ -243,7 +271,6 @@ class TestHealthService:
             assert result["disk_percent"] == 60.0
             assert len(result["warnings"]) == 0
     
-    @pytest.mark.asyncio
     async def test_check_system_resources_high_usage(self, health_service):
         """Test system resources check with high usage."""
         mock_memory = MagicMock()
@@ -264,7 +291,6 @@ class TestHealthService:
             assert result["status"] == HealthStatus.DEGRADED
             assert len(result["warnings"]) == 3  # CPU, memory, and disk warnings
     
-    @pytest.mark.asyncio
     async def test_check_system_resources_psutil_not_available(self, health_service):
         """Test system resources check when psutil is not available."""
         with patch('app.services.health_service.psutil', side_effect=ImportError):
@@ -273,7 +299,6 @@ class TestHealthService:
             assert result["status"] == HealthStatus.UNKNOWN
             assert "psutil not available" in result["error"]
     
-    @pytest.mark.asyncio
     async def test_get_readiness_status_ready(self, health_service):
         """Test readiness status when services are ready."""
         with patch.object(health_service, '_quick_chroma_check', new_callable=AsyncMock, return_value=True), \
@@ -285,7 +310,6 @@ class TestHealthService:
             assert result["services"]["chroma"] is True
             assert result["services"]["embeddings"] is True
     
-    @pytest.mark.asyncio
     async def test_get_readiness_status_not_ready(self, health_service):
         """Test readiness status when services are not ready."""
         with patch.object(health_service, '_quick_chroma_check', new_callable=AsyncMock, return_value=False), \
@@ -297,7 +321,6 @@ class TestHealthService:
             assert result["services"]["chroma"] is False
             assert result["services"]["embeddings"] is True
     
-    @pytest.mark.asyncio
     async def test_check_service_connectivity_chroma(self, health_service):
         """Test checking specific service connectivity."""
         with patch.object(health_service, '_check_chroma_health', new_callable=AsyncMock) as mock_check:
@@ -308,7 +331,6 @@ class TestHealthService:
             assert result["status"] == HealthStatus.HEALTHY
             mock_check.assert_called_once()
     
-    @pytest.mark.asyncio
     async def test_check_service_connectivity_unknown_service(self, health_service):
         """Test checking unknown service connectivity."""
         result = await health_service.check_service_connectivity("unknown")
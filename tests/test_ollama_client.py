@@ -78,14 +78,12 @@ class TestOllamaModelInfo:
 class TestOllamaClient:
     """Test OllamaClient class."""
     
-    @pytest.mark.asyncio
     async def test_client_initialization(self, ollama_client):
         """Test client initialization."""
         assert ollama_client.base_url == "http://localhost:11434"
         assert ollama_client.timeout == 30
         assert ollama_client.session is None
     
-    @pytest.mark.asyncio
     async def test_ensure_session(self, ollama_client):
         """Test session creation."""
         await ollama_client._ensure_session()
@@ -94,7 +92,6 @@ class TestOllamaClient:
         # Clean up
         await ollama_client.close()
     
-    @pytest.mark.asyncio
     async def test_context_manager(self, ollama_client):
         """Test async context manager."""
         async with ollama_client as client:
@@ -103,7 +100,6 @@ class TestOllamaClient:
         # Session should be closed after context
         assert ollama_client.session.closed
     
-    @pytest.mark.asyncio
     async def test_health_check_success(self, ollama_client, mock_session):
         """Test successful health check."""
         # Mock successful response
@@ -118,7 +114,6 @@ class TestOllamaClient:
         
         mock_session.get.assert_called_once_with("http://localhost:11434/api/tags")
     
-    @pytest.mark.asyncio
     async def test_health_check_failure(self, ollama_client, mock_session):
         """Test failed health check."""
         # Mock failed response
@@ -131,7 +126,6 @@ class TestOllamaClient:
         result = await ollama_client.health_check()
         assert result is False
     
-    @pytest.mark.asyncio
     async def test_list_models_success(self, ollama_client, mock_session):
         """Test successful model listing."""
         # Mock response data
@@ -168,7 +162,6 @@ class TestOllamaClient:
         assert models[0].is_available is True
         assert models[1].name == "codellama"
     
-    @pytest.mark.asyncio
     async def test_list_models_cache(self, ollama_client, mock_session):
         """Test model listing with cache."""
         # Mock response
@@ -196,7 +189,6 @@ class TestOllamaClient:
         assert len(models3) == 1
         assert mock_session.get.call_count == 2
     
-    @pytest.mark.asyncio
     async def test_list_models_error(self, ollama_client, mock_session):
         """Test model listing error."""
         mock_response = AsyncMock()
@@ -210,7 +202,6 @@ class TestOllamaClient:
         
         assert "Failed to list models" in str(exc_info.value)
     
-    @pytest.mark.asyncio
     async def test_model_exists(self, ollama_client):
         """Test model existence check."""
         # Mock list_models to return test models
@@ -223,7 +214,6 @@ class TestOllamaClient:
             assert await ollama_client.model_exists("llama2") is True
             assert await ollama_client.model_exists("nonexistent") is False
     
-    @pytest.mark.asyncio
     async def test_generate_success(self, ollama_client, mock_session):
         """Test successful text generation."""
         # Mock model exists
@@ -257,7 +247,6 @@ class TestOllamaClient:
             assert responses[0]["response"] == "Hello! How can I help you?"
             assert responses[0]["done"] is True
     
-    @pytest.mark.asyncio
     async def test_generate_model_not_found(self, ollama_client):
         """Test generation with non-existent model."""
         with patch.object(ollama_client, 'model_exists', return_value=False):
@@ -267,7 +256,6 @@ class TestOllamaClient:
             
             assert "not available locally" in str(exc_info.value)
     
-    @pytest.mark.asyncio
     async def test_generate_streaming(self, ollama_client, mock_session):
         """Test streaming text generation."""
         with patch.object(ollama_client, 'model_exists', return_value=True):
@@ -298,7 +286,6 @@ class TestOllamaClient:
             assert responses[1]["response"] == " there"
             assert responses[2]["done"] is True
     
-    @pytest.mark.asyncio
     async def test_chat_success(self, ollama_client, mock_session):
         """Test successful chat."""
         with patch.object(ollama_client, 'model_exists', return_value=True):
@@ -323,7 +310,6 @@ class TestOllamaClient:
             assert len(responses) == 1
             assert responses[0]["message"]["content"] == "Hello! How can I help?"
     
-    @pytest.mark.asyncio
     async def test_pull_model(self, ollama_client, mock_session):
         """Test model pulling."""
         # Mock streaming pull response
@@ -348,7 +334,6 @@ class TestOllamaClient:
         assert responses[0]["status"] == "downloading"
         assert responses[2]["status"] == "success"
     
-    @pytest.mark.asyncio
     async def test_get_model_info(self, ollama_client):
         """Test getting specific model info."""
         test_models = [
@@ -375,7 +360,6 @@ class TestOllamaClient:
         expected = len(text) // 4
         assert tokens == expected
     
-    @pytest.mark.asyncio
     async def test_validate_model_success(self, ollama_client):
         """Test successful model validation."""
         test_model = OllamaModelInfo("llama2", size="3.8GB", digest="abc123")
@@ -393,7 +377,6 @@ class TestOllamaClient:
                 assert result["test_successful"] is True
                 assert "model_info" in result
     
-    @pytest.mark.asyncio
     async def test_validate_model_not_found(self, ollama_client):
         """Test validation of non-existent model."""
         with patch.object(ollama_client, 'get_model_info', return_value=None):
@@ -403,7 +386,6 @@ class TestOllamaClient:
             assert result["available"] is False
             assert "not found" in result["error"]
     
-    @pytest.mark.asyncio
     async def test_validate_model_generation_fails(self, ollama_client):
         """Test validation when model generation fails."""
         test_model = OllamaModelInfo("llama2", size="3.8GB", digest="abc123")
@@ -116,7 +116,6 @@ class TestSearchEngine:
             }
         ]
     
-    @pytest.mark.asyncio
     async def test_semantic_search_basic(self, search_engine, mock_vector_db, sample_vector_results):
         """Test basic semantic search functionality."""
         # Setup
@@ -148,7 +147,6 @@ class TestSearchEngine:
         assert response.results[1].rank == 2
         assert response.results[2].rank == 3
     
-    @pytest.mark.asyncio
     async def test_semantic_search_with_filters(self, search_engine, mock_vector_db, sample_vector_results):
         """Test semantic search with various filters."""
         mock_vector_db.search_similar.return_value = sample_vector_results
@@ -174,7 +172,6 @@ class TestSearchEngine:
         assert call_args[1]["min_similarity"] == 0.8
         assert call_args[1]["top_k"] == 10  # Should be doubled for better ranking
     
-    @pytest.mark.asyncio
     async def test_semantic_search_with_highlighting(self, search_engine, mock_vector_db, sample_vector_results):
         """Test semantic search with content highlighting."""
         mock_vector_db.search_similar.return_value = sample_vector_results
@@ -193,7 +190,6 @@ class TestSearchEngine:
             if "machine" in result.chunk.content.lower():
                 assert "<mark>" in result.highlighted_content
     
-    @pytest.mark.asyncio
     async def test_semantic_search_date_filtering(self, search_engine, mock_vector_db, sample_vector_results):
         """Test semantic search with date range filtering."""
         mock_vector_db.search_similar.return_value = sample_vector_results
@@ -214,7 +210,6 @@ class TestSearchEngine:
         for result in response.results:
             assert result.chunk.created_at >= date_from
     
-    @pytest.mark.asyncio
     async def test_hybrid_search(self, search_engine, mock_vector_db, sample_vector_results):
         """Test hybrid search combining semantic and lexical matching."""
         mock_vector_db.search_similar.return_value = sample_vector_results
@@ -235,7 +230,6 @@ class TestSearchEngine:
         # Should have called vector database twice (semantic + lexical base)
         assert mock_vector_db.search_similar.call_count >= 1
     
-    @pytest.mark.asyncio
     async def test_context_retrieval_for_rag(self, search_engine, mock_vector_db, sample_vector_results):
         """Test context retrieval optimized for RAG."""
         mock_vector_db.search_similar.return_value = sample_vector_results
@@ -260,7 +254,6 @@ class TestSearchEngine:
         assert "Source:" in response.context  # Should include source information
         assert "Section:" in response.context  # Should include section titles
     
-    @pytest.mark.asyncio
     async def test_context_retrieval_token_limit(self, search_engine, mock_vector_db):
         """Test context retrieval respects token limits."""
         # Create large chunks that would exceed token limit
@@ -297,7 +290,6 @@ class TestSearchEngine:
         assert response.total_tokens <= request.max_tokens
         assert response.truncated  # Should be truncated due to token limit
     
-    @pytest.mark.asyncio
     async def test_search_suggestions(self, search_engine, mock_vector_db):
         """Test search suggestions functionality."""
         suggestions = await search_engine.get_search_suggestions("machine", max_suggestions=5)
@@ -307,7 +299,6 @@ class TestSearchEngine:
             assert "machine" in suggestion.suggestion.lower()
             assert suggestion.frequency > 0
     
-    @pytest.mark.asyncio
     async def test_search_stats(self, search_engine, mock_vector_db, sample_vector_results):
         """Test search statistics tracking."""
         # Perform some searches to generate stats
@@ -328,7 +319,6 @@ class TestSearchEngine:
         assert "vector_db_stats" in stats
         assert "embedding_service_stats" in stats
     
-    @pytest.mark.asyncio
     async def test_result_ranking_content_boost(self, search_engine, mock_vector_db):
         """Test result ranking with content quality boosts."""
         # Create results with different content characteristics
@@ -374,7 +364,6 @@ class TestSearchEngine:
         assert response.results[0].chunk.id == "chunk_exact"
         assert response.results[0].similarity_score > 0.8  # Should be boosted
     
-    @pytest.mark.asyncio
     async def test_lexical_scoring(self, search_engine):
         """Test lexical scoring algorithm."""
         # Test the private method directly
@@ -398,7 +387,6 @@ class TestSearchEngine:
         assert 0 <= score2 <= 1
         assert score3 == 0
     
-    @pytest.mark.asyncio
     async def test_query_term_extraction(self, search_engine):
         """Test query term extraction."""
         # Test the private method directly
@@ -412,7 +400,6 @@ class TestSearchEngine:
         assert "what" not in terms  # Stop word
         assert "are" not in terms   # Stop word
     
-    @pytest.mark.asyncio
     async def test_error_handling_vector_db_failure(self, search_engine, mock_vector_db):
         """Test error handling when vector database fails."""
         mock_vector_db.search_similar.side_effect = Exception("Database connection failed")
@@ -424,7 +411,6 @@ class TestSearchEngine:
         
         assert "Semantic search failed" in str(exc_info.value)
     
-    @pytest.mark.asyncio
     async def test_error_handling_embedding_failure(self, search_engine, mock_embedding_service):
         """Test error handling when embedding generation fails."""
         mock_embedding_service.generate_embedding.side_effect = Exception("Embedding model failed")
@@ -436,7 +422,6 @@ class TestSearchEngine:
         
         assert "Semantic search failed" in str(exc_info.value)
     
-    @pytest.mark.asyncio
     async def test_empty_results_handling(self, search_engine, mock_vector_db):
         """Test handling of empty search results."""
         mock_vector_db.search_similar.return_value = []
@@ -448,7 +433,6 @@ class TestSearchEngine:
         assert response.total_results == 0
         assert response.search_time > 0
     
-    @pytest.mark.asyncio
     async def test_malformed_vector_results_handling(self, search_engine, mock_vector_db):
         """Test handling of malformed vector database results."""
         # Malformed results missing required fields
@@ -559,7 +543,6 @@ class TestSearchEnginePerformance:
             for i in range(1000)  # Large dataset
         ]
     
-    @pytest.mark.asyncio
     async def test_search_performance_large_dataset(self, search_engine, mock_vector_db, large_result_set):
         """Test search performance with large dataset."""
         mock_vector_db.search_similar.return_value = large_result_set
@@ -581,7 +564,6 @@ class TestSearchEnginePerformance:
         for i in range(len(response.results) - 1):
             assert response.results[i].similarity_score >= response.results[i + 1].similarity_score
     
-    @pytest.mark.asyncio
     async def test_context_retrieval_performance(self, search_engine, mock_vector_db, large_result_set):
         """Test context retrieval performance."""
         mock_vector_db.search_similar.return_value = large_result_set[:100]  # Reasonable subset
@@ -642,7 +624,6 @@ class TestSearchEngineIntegration:
             default_chunk_overlap=50
         )
     
-    @pytest.mark.asyncio
     async def test_end_to_end_search_workflow(self, search_engine, mock_vector_db, mock_embedding_service):
         """Test complete search workflow from query to results."""
         # Setup realistic scenario
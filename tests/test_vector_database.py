@@ -69,7 +69,6 @@ def sample_embeddings():
 class TestVectorDatabaseService:
     """Test cases for VectorDatabaseService."""
     
-    @pytest.mark.asyncio
     async def test_connect_success(self, vector_db_service):
         """Test successful connection to ChromaDB."""
         with patch('chromadb.PersistentClient') as mock_client:
@@ -82,14 +81,12 @@ class TestVectorDatabaseService:
             assert vector_db_service._client is not None
             assert vector_db_service._collection is not None
     
-    @pytest.mark.asyncio
     async def test_connect_failure(self, vector_db_service):
         """Test connection failure handling."""
         with patch('chromadb.PersistentClient', side_effect=Exception("Connection failed")):
             with pytest.raises(VectorDatabaseError, match="Connection failed"):
                 await vector_db_service.connect()
     
-    @pytest.mark.asyncio
     async def test_health_check_healthy(self, vector_db_service):
         """Test health check when service is healthy."""
         with patch('chromadb.PersistentClient') as mock_client:
@@ -108,7 +105,6 @@ class TestVectorDatabaseService:
             assert health["document_count"] == 10
             assert "timestamp" in health
     
-    @pytest.mark.asyncio
     async def test_health_check_unhealthy(self, vector_db_service):
         """Test health check when service is unhealthy."""
         health = await vector_db_service.health_check()
@@ -117,7 +113,6 @@ class TestVectorDatabaseService:
         assert "Not connected" in health["message"]
         assert "timestamp" in health
     
-    @pytest.mark.asyncio
     async def test_store_embeddings_success(self, vector_db_service, sample_chunks, sample_embeddings):
         """Test successful embedding storage."""
         with patch('chromadb.PersistentClient') as mock_client:
@@ -132,7 +127,6 @@ class TestVectorDatabaseService:
             assert all(chunk_id.startswith("chunk_") for chunk_id in result)
             mock_collection.add.assert_called_once()
     
-    @pytest.mark.asyncio
     async def test_store_embeddings_validation_error(self, vector_db_service, sample_chunks):
         """Test embedding storage with validation error."""
         with patch('chromadb.PersistentClient') as mock_client:
@@ -146,7 +140,6 @@ class TestVectorDatabaseService:
             with pytest.raises(VectorDatabaseError, match="Storage failed"):
                 await vector_db_service.store_embeddings(sample_chunks, [[0.1, 0.2]])
     
-    @pytest.mark.asyncio
     async def test_store_embeddings_empty_list(self, vector_db_service):
         """Test embedding storage with empty lists."""
         with patch('chromadb.PersistentClient') as mock_client:
@@ -158,7 +151,6 @@ class TestVectorDatabaseService:
             
             assert result == []
     
-    @pytest.mark.asyncio
     async def test_search_similar_success(self, vector_db_service):
         """Test successful similarity search."""
         with patch('chromadb.PersistentClient') as mock_client:
@@ -180,7 +172,6 @@ class TestVectorDatabaseService:
             assert results[1]["similarity_score"] == 0.7  # 1 - 0.3
             assert results[0]["content"] == "Test content 1"
     
-    @pytest.mark.asyncio
     async def test_search_similar_with_filters(self, vector_db_service):
         """Test similarity search with filters."""
         with patch('chromadb.PersistentClient') as mock_client:
@@ -208,7 +199,6 @@ class TestVectorDatabaseService:
             call_args = mock_collection.query.call_args[1]
             assert "where" in call_args
     
-    @pytest.mark.asyncio
     async def test_search_similar_min_similarity_filter(self, vector_db_service):
         """Test similarity search with minimum similarity threshold."""
         with patch('chromadb.PersistentClient') as mock_client:
@@ -234,7 +224,6 @@ class TestVectorDatabaseService:
             assert len(results) == 1
             assert results[0]["similarity_score"] == 0.9
     
-    @pytest.mark.asyncio
     async def test_search_similar_validation_error(self, vector_db_service):
         """Test search with invalid query embedding."""
         with patch('chromadb.PersistentClient') as mock_client:
@@ -250,7 +239,6 @@ class TestVectorDatabaseService:
             with pytest.raises(VectorDatabaseError, match="Search failed"):
                 await vector_db_service.search_similar([])
     
-    @pytest.mark.asyncio
     async def test_delete_by_document_id_success(self, vector_db_service):
         """Test successful deletion by document ID."""
         with patch('chromadb.PersistentClient') as mock_client:
@@ -264,7 +252,6 @@ class TestVectorDatabaseService:
             assert deleted_count == 3
             mock_collection.delete.assert_called_once_with(where={"document_id": "doc1"})
     
-    @pytest.mark.asyncio
     async def test_delete_by_document_id_no_chunks(self, vector_db_service):
         """Test deletion when no chunks exist for document."""
         with patch('chromadb.PersistentClient') as mock_client:
@@ -278,7 +265,6 @@ class TestVectorDatabaseService:
             assert deleted_count == 0
             mock_collection.delete.assert_not_called()
     
-    @pytest.mark.asyncio
     async def test_delete_by_ids_success(self, vector_db_service):
         """Test successful deletion by chunk IDs."""
         with patch('chromadb.PersistentClient') as mock_client:
@@ -292,7 +278,6 @@ class TestVectorDatabaseService:
             assert deleted_count == 3
             mock_collection.delete.assert_called_once_with(ids=chunk_ids)
     
-    @pytest.mark.asyncio
     async def test_delete_by_ids_empty_list(self, vector_db_service):
         """Test deletion with empty ID list."""
         with patch('chromadb.PersistentClient') as mock_client:
@@ -305,7 +290,6 @@ class TestVectorDatabaseService:
             assert deleted_count == 0
             mock_collection.delete.assert_not_called()
     
-    @pytest.mark.asyncio
     async def test_get_collection_stats(self, vector_db_service):
         """Test collection statistics retrieval."""
         with patch('chromadb.PersistentClient') as mock_client:
@@ -330,7 +314,6 @@ class TestVectorDatabaseService:
             assert "en" in stats["languages"]
             assert "fr" in stats["languages"]
     
-    @pytest.mark.asyncio
     async def test_reset_collection_success(self, vector_db_service):
         """Test successful collection reset."""
         with patch('chromadb.PersistentClient') as mock_client:
@@ -344,7 +327,6 @@ class TestVectorDatabaseService:
             assert result is True
             mock_client.return_value.delete_collection.assert_called_once()
     
-    @pytest.mark.asyncio
     async def test_validate_schema_success(self, vector_db_service):
         """Test successful schema validation."""
         with patch('chromadb.PersistentClient') as mock_client:
@@ -373,7 +355,6 @@ class TestVectorDatabaseService:
             assert validation["schema_valid"] is True
             assert "sample_metadata_keys" in validation
     
-    @pytest.mark.asyncio
     async def test_validate_schema_collection_not_exists(self, vector_db_service):
         """Test schema validation when collection doesn't exist."""
         with patch('chromadb.PersistentClient') as mock_client:
@@ -384,7 +365,6 @@ class TestVectorDatabaseService:
             
             assert validation["collection_exists"] is False
     
-    @pytest.mark.asyncio
     async def test_build_where_clause(self, vector_db_service):
         """Test where clause building for filters."""
         # Test with various filter types
@@ -406,7 +386,6 @@ class TestVectorDatabaseService:
         assert where_clause["chunk_index"]["$lte"] == 10
         assert "invalid_filter" not in where_clause
     
-    @pytest.mark.asyncio
     async def test_build_where_clause_empty(self, vector_db_service):
         """Test where clause building with empty filters."""
         where_clause = vector_db_service._build_where_clause({})
@@ -415,7 +394,6 @@ class TestVectorDatabaseService:
         where_clause = vector_db_service._build_where_clause(None)
         assert where_clause is None
     
-    @pytest.mark.asyncio
     async def test_ensure_connected_auto_connect(self, vector_db_service):
         """Test automatic connection when not connected."""
         with patch('chromadb.PersistentClient') as mock_client:
@@ -430,7 +408,6 @@ class TestVectorDatabaseService:
             
             assert vector_db_service._is_connected is True
     
-    @pytest.mark.asyncio
     async def test_disconnect(self, vector_db_service):
         """Test disconnection from ChromaDB."""
         with patch('chromadb.PersistentClient') as mock_client:
@@ -471,7 +448,6 @@ class TestVectorDatabaseServiceIntegration:
         service._temp_path = temp_db_path
         return service
     
-    @pytest.mark.asyncio
     @pytest.mark.integration
     async def test_full_workflow_integration(self, integration_service, sample_chunks, sample_embeddings):
         """Test complete workflow with real ChromaDB operations."""
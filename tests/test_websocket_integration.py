@@ -7,29 +7,13 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
 from typing import Dict, Any, List
 
-from fastapi import FastAPI
-from fastapi.testclient import TestClient
 from fastapi.websockets import WebSocket
 
 from app.models.chat import (
     ChatMessage, Conversation, MessageRole, ConversationStatus,
     StreamingChatResponse
 )
-from app.api.endpoints.chat import router, WebSocketManager
-
-
-@pytest.fixture
-def app():
-    """Create test FastAPI app with WebSocket support."""
-    app = FastAPI()
-    app.include_router(router, prefix="/chat")
-    return app
-
-
-@pytest.fixture
-def client(app):
-    """Create test client."""
-    return TestClient(app)
+from app.api.endpoints.chat import WebSocketManager
 
 
 @pytest.fixture
@@ -91,6 +75,11 @@ def sample_streaming_response():
 class TestWebSocketManager:
     """Test WebSocket manager functionality."""
     
+    def test_initialization(self, websocket_manager):
+        """Test WebSocket manager starts with no connections."""
+        assert websocket_manager.active_connections == {}
+        assert websocket_manager.connection_metadata == {}
+    
     async def test_single_connection(self, websocket_manager, mock_websocket):
         """Test single WebSocket connection."""
         # Connect
@@ -199,9 +188,9 @@ class TestWebSocketManager:
         await websocket_manager.send_to_conversation("conv-123", message)
         
         # Verify all clients received the message
-        expected_json = json.dumps(message)
         for ws in websockets:
-            ws.send_text.assert_called_once_with(expected_json)
+            ws.send_text.assert_called_once()
+            assert json.loads(ws.send_text.call_args[0][0]) == message
     
     async def test_send_to_nonexistent_conversation(self, websocket_manager):
         """Test sending to a conversation with no connections."""
@@ -322,7 +311,7 @@ class TestWebSocketEndpoint:
 class TestWebSocketIntegration:
     """Integration tests for WebSocket functionality."""
     
-    def test_websocket_endpoint_exists(self, client):
+    def test_websocket_endpoint_exists(self, chat_test_client):
         """Test that WebSocket endpoint is properly configured."""
         # This tests that the endpoint is registered
         # Actual WebSocket testing requires specialized tools